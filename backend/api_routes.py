@@ -9,25 +9,216 @@ Citations:
 """
 
 import os
-import csv
+import gzip
+import math
+import logging
 import signal
 import threading
-from flask import Flask, jsonify, request
-from config import trading_state, ORDER_CSV_PATH, THRESHOLD_CSV_PATH, get_indicator_periods
-from file_manager import get_historical_data, load_trading_thresholds, get_current_position_from_orders, get_row_count
-from trading_engine import check_trading_signals_with_thresholds
+import time
+from itertools import islice
+import orjson
+from flask import Flask, Response, request
+from auth import register_auth_routes, require_auth
+from config import trading_state, PARAMETER_RANGES, ORDER_CSV_PATH, THRESHOLD_CSV_PATH, get_indicator_periods, get_min_required
+from file_manager import (
+    get_historical_data, load_trading_thresholds, get_current_position_from_orders, get_row_count,
+    read_recent_orders, get_order_columns, load_order_summary, flush_market_data,
+    invalidate_trading_thresholds
+)
+
+logger = logging.getLogger(__name__)
+
+# values derived from file_manager's thresholds cache - rebuilt whenever it hands back a new dict
+_thresholds_cache = {
+    "value": None, "periods": None, "min_required": None, "parameters_body": None
+}
+_thresholds_lock = threading.Lock()
+
+def _refresh_thresholds_cache():
+    """Rebuild the derived values only when load_trading_thresholds re-parsed the file"""
+    thresholds = load_trading_thresholds()  # one stat - returns the same dict until the file changes
+    
+    with _thresholds_lock:
+        if thresholds is not _thresholds_cache['value']:
+            periods = get_indicator_periods(thresholds['indicator_window'])
+            _thresholds_cache['periods'] = periods
+            # minimum candles before indicators are available - only changes with indicator_window
+            _thresholds_cache['min_required'] = get_min_required(thresholds['indicator_window'])
+            # /parameters is a pure function of the thresholds, so serialize it once per change
+            _thresholds_cache['parameters_body'] = orjson.dumps({
+                "current_parameters": thresholds,
+                "derived_periods": periods
+            })
+            _thresholds_cache['value'] = thresholds
+        return _thresholds_cache
+
+def _cached_thresholds():
+    """Return (thresholds, periods, min_required) from the threshold cache"""
+    cache = _refresh_thresholds_cache()
+    return cache['value'], cache['periods'], cache['min_required']
+
+GZIP_MIN_BYTES = 1024  # smaller bodies aren't worth compressing
+STATUS_STREAM_KEEPALIVE = 15  # seconds between keepalive comments on an idle status stream
+
+# CORS headers are identical for every response - built once at import time
+_CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Headers', 'Content-Type,Authorization'),
+    ('Access-Control-Allow-Methods', 'GET,POST,PUT,DELETE,OPTIONS'),
+)
+
+# threshold.csv column order - shared by validation and the CSV writer
+_THRESHOLD_FIELDS = (
+    'trade_size', 'stop_loss', 'stop_profit', 'rsi_buy_threshold',
+    'rsi_sell_threshold', 'macd_buy_threshold', 'macd_sell_threshold',
+    'position_size_usdt', 'active', 'loop_interval', 'indicator_window'
+)
+_REQUIRED_FIELDS = frozenset(_THRESHOLD_FIELDS)
+_THRESHOLD_HEADER = (','.join(_THRESHOLD_FIELDS) + '\n').encode('utf-8')
+
+# fields of the newest candle reported by /status
+_LATEST_KEYS = ('price', 'datetime', 'rsi', 'macd', 'signal_line')
+
+# serialized /market-data body as one (key, body) pair, keyed on (record count, newest datetime)
+# - replaced in a single assignment so a request never pairs a new key with an old body
+_market_data_cache = (None, None)
+
+def _threshold_csv_value(value):
+    """
+    Coerce one posted threshold to a number for threshold.csv.
+    Raises ValueError for anything else - a string could carry commas or newlines into the row.
+    """
+    if isinstance(value, bool):
+        return int(value)  # active as true/false - the loader reads 1/0
+    if isinstance(value, str):
+        value = float(value)  # numeric strings are accepted, "0.5,0.9" is not
+    if not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{value!r} is not a finite number")
+    return value
+
+def _json(obj, status=200, option=None):
+    """Serialize a response body with orjson - much faster than Flask's stdlib-based jsonify"""
+    try:
+        body = orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError as e:
+        # orjson rejects what jsonify tolerated (ints over 64 bits, non-str keys) - report it clearly
+        logger.error("❌ Could not encode response body: %s", e)
+        body, status = orjson.dumps({"error": f"Failed to encode response: {e}"}), 500
+    return Response(body, status=status, mimetype='application/json')
+
+def _maybe_gzip(response):
+    """Gzip non-streamed responses over 1 KB when the client accepts it - numeric JSON compresses well"""
+    if (response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    # the body may be gzipped for some clients, so every eligible response varies on the header
+    response.vary.add('Accept-Encoding')
+    
+    # parsed quality value - 0 when gzip is absent or refused with q=0
+    if not request.accept_encodings['gzip']:
+        return response
+    
+    body = response.get_data()
+    if len(body) <= GZIP_MIN_BYTES:
+        return response
+    
+    # level 1 gets most of the size reduction on JSON floats at a fraction of the CPU cost
+    response.set_data(gzip.compress(body, compresslevel=1))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+def _iter_ndjson(rows):
+    """Yield one JSON document per line so clients can start parsing before the body is complete"""
+    for row in rows:
+        yield orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+
+def _build_status():
+    """Assemble the /status payload - shared by the polled endpoint and the push stream"""
+    # gather all system status information
+    historical_data = get_historical_data()
+    thresholds, periods, min_required = _cached_thresholds()
+    current_position, last_trade_price = get_current_position_from_orders()
+    
+    try:
+        latest = historical_data[-1]  # most recent data point
+    except IndexError:
+        # minimal response when no data is available yet
+        return {
+            "status": "running" if not trading_state.ending else "stopped", 
+            "message": "No data yet",
+            "configuration": {
+                "indicator_window": thresholds['indicator_window'],
+                "loop_interval": thresholds['loop_interval'],
+                "active": thresholds['active']
+            }
+        }
+    
+    # calculate unrealized P&L if we have an open position
+    unrealized_pnl = None
+    if current_position and last_trade_price:
+        if current_position == 'LONG':
+            unrealized_pnl = ((latest['price'] - last_trade_price) / last_trade_price) * 100
+        elif current_position == 'SHORT':
+            unrealized_pnl = ((last_trade_price - latest['price']) / last_trade_price) * 100
+    
+    # comprehensive status response with all relevant data
+    return {
+        "status": "running" if not trading_state.ending else "stopped",
+        "latest_data": {key: latest[key] for key in _LATEST_KEYS},
+        "indicators": {
+            "available": latest['rsi'] is not None,
+            "periods": periods,
+            "min_required": min_required
+        },
+        "position": {
+            "current_position": current_position,
+            "last_trade_price": last_trade_price,
+            "unrealized_pnl_percent": unrealized_pnl
+        },
+        "data_stats": {
+            "total_records": get_row_count(),
+            "cached_records": len(historical_data)
+        },
+        "configuration": {
+            "indicator_window": thresholds['indicator_window'],
+            "loop_interval": thresholds['loop_interval'],
+            "active": thresholds['active']
+        }
+    }
+
+def _iter_status_events():
+    """
+    Yield a server-sent event with the full status each time a new candle is cached.
+    Idle periods send a comment line so proxies and clients keep the connection open.
+    """
+    seen_version = None
+    while not trading_state.ending:
+        with trading_state.data_updated:
+            trading_state.data_updated.wait_for(
+                lambda: trading_state.data_version != seen_version or trading_state.ending,
+                timeout=STATUS_STREAM_KEEPALIVE
+            )
+            changed = trading_state.data_version != seen_version
+            seen_version = trading_state.data_version
+        
+        if changed:
+            yield b'data: ' + orjson.dumps(_build_status()) + b'\n\n'
+        else:
+            yield b': keepalive\n\n'
 
 def create_app():
     """Create and configure Flask application with manual CORS handling"""
     app = Flask(__name__)
     
+    # start the shutdown watcher once so /end never has to spawn threads
+    threading.Thread(target=_shutdown_watcher, daemon=True).start()
+    
     @app.after_request
     def after_request(response):
-        """Add CORS headers to all responses"""
-        response.headers.add('Access-Control-Allow-Origin', '*')
-        response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-        response.headers.add('Access-Control-Allow-Methods', 'GET,POST,PUT,DELETE,OPTIONS')
-        return response
+        """Add CORS headers to all responses and compress large JSON bodies"""
+        response.headers.extend(_CORS_HEADERS)
+        return _maybe_gzip(response)
     
     @app.route('/options', defaults={'path': ''}, methods=['OPTIONS'])
     @app.route('/<path:path>', methods=['OPTIONS'])
@@ -37,230 +228,209 @@ def create_app():
     
     return app
 
+# set by /end - a single pre-started watcher thread performs the actual shutdown
+_shutdown_event = threading.Event()
+
+def _shutdown_watcher():
+    """Wait for a shutdown request, then stop trading and terminate the process"""
+    _shutdown_event.wait()
+    time.sleep(0.5)  # small delay so the /end response can be sent
+    trading_state.request_stop()  # signal trading loop to stop
+    print("\n🛑 Shutdown initiated from web interface...")
+    time.sleep(2.0)  # delayed termination to allow in-flight work to finish
+    flush_market_data()  # SIGTERM skips atexit handlers, so drain buffered ticks first
+    os.kill(os.getpid(), signal.SIGTERM)
+
 def shutdown_server():
-    """Gracefully shutdown the Flask server using threading and OS signals"""
-    def shutdown():
-        trading_state.ending = True  # signal trading loop to stop
-        print("\n🛑 Shutdown initiated from web interface...")
-        # delayed termination to allow response to be sent
-        threading.Timer(2.0, lambda: os.kill(os.getpid(), signal.SIGTERM)).start()
-    
-    # small delay before starting shutdown process
-    threading.Timer(0.5, shutdown).start()
+    """Gracefully shutdown the Flask server - repeated calls are harmless"""
+    _shutdown_event.set()
 
-def register_routes(app):
-    """Register all API routes with the Flask app"""
-    
-    from auth import register_auth_routes, require_auth
-    
-    # register authentication routes first
-    register_auth_routes(app)
-    
-    @app.route('/')
-    def hello_world():
-        # API info endpoint - provides basic system information
-        return jsonify({
-            "message": "Crypto Trading Bot API with Secure Authentication",
-            "version": "2.2",
-            "login": "POST /login with username and password",
-            "status": "Secure authentication required for all endpoints"
-        })
+def hello_world():
+    # API info endpoint - provides basic system information
+    return _json({
+        "message": "Crypto Trading Bot API with Secure Authentication",
+        "version": "2.2",
+        "login": "POST /login with username and password",
+        "status": "Secure authentication required for all endpoints"
+    })
 
-    @app.route('/end', methods=['POST'])
-    @require_auth  # authentication required for shutdown
-    def signal_end():
-        try:
-            shutdown_server()
-            return jsonify({
-                "message": "Trading bot shutdown initiated", 
-                "status": "stopping"
-            })
-        except Exception as e:
-            return jsonify({"error": f"Shutdown failed: {str(e)}"}), 500
+@require_auth  # authentication required for shutdown
+def signal_end():
+    try:
+        shutdown_server()
+        return _json({
+            "message": "Trading bot shutdown initiated", 
+            "status": "stopping"
+        })
+    except Exception as e:
+        return _json({"error": f"Shutdown failed: {str(e)}"}, 500)
 
-    @app.route('/save-config', methods=['POST'])
-    @require_auth  # protect configuration changes
-    def save_configuration():
+@require_auth  # protect configuration changes
+def save_configuration():
+    try:
+        # parse the raw body directly with orjson instead of going through request.get_json()
+        raw_body = request.get_data(cache=False)
+        if not raw_body:
+            return _json({"error": "No configuration data provided"}, 400)
         try:
-            data = request.get_json()
-            if not data:
-                return jsonify({"error": "No configuration data provided"}), 400
-            
-            # validate all required fields are present
-            required_fields = [
-                'trade_size', 'stop_loss', 'stop_profit', 'rsi_buy_threshold',
-                'rsi_sell_threshold', 'macd_buy_threshold', 'macd_sell_threshold',
-                'position_size_usdt', 'active', 'loop_interval', 'indicator_window'
-            ]
-            
-            for field in required_fields:
-                if field not in data:
-                    return jsonify({"error": f"Missing required field: {field}"}), 400
-            
-            # ensure directory exists before writing
-            dataframe_dir = os.path.dirname(THRESHOLD_CSV_PATH)
-            os.makedirs(dataframe_dir, exist_ok=True)
-            
-            # write configuration to CSV file for persistence
-            with open(THRESHOLD_CSV_PATH, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                writer.writerow([
-                    'trade_size', 'stop_loss', 'stop_profit', 'rsi_buy_threshold',
-                    'rsi_sell_threshold', 'macd_buy_threshold', 'macd_sell_threshold',
-                    'position_size_usdt', 'active', 'loop_interval', 'indicator_window'
-                ])
-                
-                writer.writerow([
-                    data['trade_size'], data['stop_loss'], data['stop_profit'],
-                    data['rsi_buy_threshold'], data['rsi_sell_threshold'],
-                    data['macd_buy_threshold'], data['macd_sell_threshold'],
-                    data['position_size_usdt'], data['active'],
-                    data['loop_interval'], data['indicator_window']
-                ])
-            
-            print(f"✅ Configuration saved securely")
-            return jsonify({"message": "Configuration saved successfully"})
-            
-        except Exception as e:
-            print(f"❌ Error saving configuration: {e}")
-            return jsonify({"error": f"Failed to save configuration: {str(e)}"}), 500
+            data = orjson.loads(raw_body)
+        except orjson.JSONDecodeError:
+            return _json({"error": "Invalid JSON in configuration data"}, 400)
+        if not data or not isinstance(data, dict):
+            return _json({"error": "No configuration data provided"}, 400)
+        
+        # validate all required fields are present - one set difference reports every missing field
+        missing = _REQUIRED_FIELDS - data.keys()
+        if missing:
+            return _json({"error": f"Missing required fields: {', '.join(sorted(missing))}"}, 400)
+        
+        # every field must be numeric - that is what lets the row below skip csv quoting
+        values = []
+        for field in _THRESHOLD_FIELDS:
+            try:
+                value = _threshold_csv_value(data[field])
+            except (TypeError, ValueError):
+                return _json({"error": f"Invalid value for {field}: must be a number"}, 400)
+            # hard limits keep huge values (1e308 windows) out of the file and out of orjson
+            ranges = PARAMETER_RANGES.get(field)
+            if ranges and not ranges['min'] <= value <= ranges['max']:
+                return _json({"error": f"Invalid value for {field}: must be between "
+                                       f"{ranges['min']} and {ranges['max']}"}, 400)
+            values.append(value)
+        
+        # ensure directory exists before writing
+        dataframe_dir = os.path.dirname(THRESHOLD_CSV_PATH)
+        os.makedirs(dataframe_dir, exist_ok=True)
+        
+        # write configuration to CSV file for persistence - values were coerced to numbers above
+        row = ','.join(map(str, values)).encode('utf-8') + b'\n'
+        with open(THRESHOLD_CSV_PATH, 'wb') as file:
+            file.write(_THRESHOLD_HEADER + row)
+        invalidate_trading_thresholds()  # a rewrite can land within the same mtime tick
+        
+        logger.info("✅ Configuration saved securely")
+        return _json({"message": "Configuration saved successfully"})
+        
+    except Exception as e:
+        logger.error("❌ Error saving configuration: %s", e)
+        return _json({"error": f"Failed to save configuration: {str(e)}"}, 500)
 
-    @app.route('/status')
-    @require_auth  # protect status information
-    def get_status():
-        try:
-            # gather all system status information
-            historical_data = get_historical_data()
-            thresholds = load_trading_thresholds()
-            current_position, last_trade_price = get_current_position_from_orders()
-            periods = get_indicator_periods(thresholds['indicator_window'])
-            
-            if historical_data:
-                latest = historical_data[-1]  # most recent data point
-                
-                # calculate unrealized P&L if we have an open position
-                unrealized_pnl = None
-                if current_position and last_trade_price:
-                    if current_position == 'LONG':
-                        unrealized_pnl = ((latest['price'] - last_trade_price) / last_trade_price) * 100
-                    elif current_position == 'SHORT':
-                        unrealized_pnl = ((last_trade_price - latest['price']) / last_trade_price) * 100
-                
-                # comprehensive status response with all relevant data
-                return jsonify({
-                    "status": "running" if not trading_state.ending else "stopped",
-                    "latest_data": {
-                        "price": latest['price'],
-                        "datetime": latest['datetime'],
-                        "rsi": latest['rsi'],
-                        "macd": latest['macd'],
-                        "signal_line": latest['signal_line']
-                    },
-                    "indicators": {
-                        "available": latest['rsi'] is not None,
-                        "periods": periods,
-                        "min_required": max(periods['rsi_window'], periods['macd_slow'], periods['signal_window'])
-                    },
-                    "position": {
-                        "current_position": current_position,
-                        "last_trade_price": last_trade_price,
-                        "unrealized_pnl_percent": unrealized_pnl
-                    },
-                    "data_stats": {
-                        "total_records": get_row_count(),
-                        "cached_records": len(historical_data)
-                    },
-                    "configuration": {
-                        "indicator_window": thresholds['indicator_window'],
-                        "loop_interval": thresholds['loop_interval'],
-                        "active": thresholds['active']
-                    }
-                })
-            else:
-                # minimal response when no data is available yet
-                return jsonify({
-                    "status": "running" if not trading_state.ending else "stopped", 
-                    "message": "No data yet",
-                    "configuration": {
-                        "indicator_window": thresholds['indicator_window'],
-                        "loop_interval": thresholds['loop_interval'],
-                        "active": thresholds['active']
-                    }
-                })
-        except Exception as e:
-            return jsonify({"status": "error", "message": f"Error reading data: {str(e)}"}), 500
+@require_auth  # protect status information
+def get_status():
+    try:
+        return _json(_build_status())
+    except Exception as e:
+        return _json({"status": "error", "message": f"Error reading data: {str(e)}"}, 500)
 
-    @app.route('/trades')
-    @require_auth  # protect trading history
-    def get_recent_trades():
-        try:
-            if not os.path.exists(ORDER_CSV_PATH):
-                return jsonify({"trades": [], "summary": {"total_trades": 0}})
-            
-            trades = []
-            # read all trades from CSV file
-            with open(ORDER_CSV_PATH, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                all_trades = list(reader)
-            
-            # return only the most recent 20 trades for performance
-            recent_trades = all_trades[-20:]
-            
-            # enhance trade data with calculated fields
-            for trade in recent_trades:
-                enhanced_trade = {
-                    "datetime": trade['datetime'],
-                    "side": trade['side'],
-                    "price": float(trade['price']),
-                    "quantity": float(trade['quantity']),
-                    "trade_size": float(trade['trade_size']),
-                    "position_value": float(trade['price']) * float(trade['quantity'])  # total value calculation
-                }
-                trades.append(enhanced_trade)
-            
-            # calculate trading statistics
-            total_trades = len(all_trades)
-            buy_trades = sum(1 for t in all_trades if t['side'] == 'BUY')
-            sell_trades = sum(1 for t in all_trades if t['side'] == 'SELL')
-            
-            summary = {
-                "total_trades": total_trades,
-                "buy_trades": buy_trades,
-                "sell_trades": sell_trades,
-                "showing_recent": len(recent_trades)
-            }
-            
-            return jsonify({"trades": trades, "summary": summary})
-        except Exception as e:
-            return jsonify({"error": f"Error reading trades: {str(e)}"}), 500
+@require_auth  # protect status information
+def stream_status():
+    # push status on every new candle instead of having clients poll /status
+    return Response(_iter_status_events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
 
-    @app.route('/parameters')
-    @require_auth  # protect configuration parameters
-    def get_parameters():
-        try:
-            thresholds = load_trading_thresholds()
-            periods = get_indicator_periods(thresholds['indicator_window'])
-            
-            # return both current config and derived technical indicator periods
-            return jsonify({
-                "current_parameters": thresholds,
-                "derived_periods": periods
+@require_auth  # protect trading history
+def get_recent_trades():
+    try:
+        if not os.path.exists(ORDER_CSV_PATH):
+            return _json({"trades": [], "summary": {"total_trades": 0}})
+        
+        # read only the tail of the order log - the full history is never needed here
+        recent_trades = read_recent_orders(20)
+        
+        # resolve column positions once instead of building a dict per row
+        columns = get_order_columns()
+        datetime_idx, side_idx = columns['datetime'], columns['side']
+        price_idx, quantity_idx, size_idx = columns['price'], columns['quantity'], columns['trade_size']
+        
+        # enhance trade data with calculated fields
+        trades = []
+        for row in recent_trades:
+            price = float(row[price_idx])
+            quantity = float(row[quantity_idx])
+            trades.append({
+                "datetime": row[datetime_idx],
+                "side": row[side_idx],
+                "price": price,
+                "quantity": quantity,
+                "trade_size": float(row[size_idx]),
+                "position_value": price * quantity  # total value calculation
             })
-        except Exception as e:
-            return jsonify({"error": f"Error getting parameters: {str(e)}"}), 500
-    
-    @app.route('/market-data')
-    @require_auth  # protect market data access
-    def get_market_data():
+        
+        # trading statistics come from the running summary instead of a full scan
+        order_summary = load_order_summary()
+        
+        summary = {
+            "total_trades": order_summary['total_trades'],
+            "buy_trades": order_summary['buy_trades'],
+            "sell_trades": order_summary['sell_trades'],
+            "showing_recent": len(recent_trades)
+        }
+        
+        return _json({"trades": trades, "summary": summary})
+    except Exception as e:
+        return _json({"error": f"Error reading trades: {str(e)}"}, 500)
+
+@require_auth  # protect configuration parameters
+def get_parameters():
+    try:
+        # return both current config and derived technical indicator periods - pre-serialized
+        body = _refresh_thresholds_cache()['parameters_body']
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return _json({"error": f"Error getting parameters: {str(e)}"}, 500)
+
+@require_auth  # protect market data access
+def get_market_data():
+    global _market_data_cache
+    try:
+        historical_data = get_historical_data()
+        
+        # only re-serialize when a new candle has arrived since the last request
         try:
-            historical_data = get_historical_data()
-            # limit to recent 100 data points for frontend performance
-            recent_data = historical_data[-100:] if len(historical_data) > 100 else historical_data
+            cache_key = (len(historical_data), historical_data[-1]['datetime'])
+        except IndexError:
+            cache_key = (0, None)  # no candles cached yet
+        cached_key, body = _market_data_cache  # one read - key and body always match
+        if cache_key != cached_key:
+            # limit to recent 100 data points for frontend performance (deque has no slicing)
+            total = len(historical_data)
+            recent_data = list(islice(historical_data, max(0, total - 100), total))
             
-            return jsonify({
+            body = orjson.dumps({
                 "data": recent_data,
                 "count": len(recent_data),
-                "total_available": len(historical_data)
+                "total_available": total
             })
-        except Exception as e:
-            return jsonify({"error": f"Error getting market data: {str(e)}"}), 500
\ No newline at end of file
+            _market_data_cache = (cache_key, body)
+        
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return _json({"error": f"Error getting market data: {str(e)}"}, 500)
+
+@require_auth  # protect market data access
+def stream_market_data():
+    try:
+        # snapshot the recent window now - the generator runs after this handler returns
+        historical_data = get_historical_data()
+        total = len(historical_data)
+        recent_data = list(islice(historical_data, max(0, total - 100), total))
+        return Response(_iter_ndjson(recent_data), mimetype='application/x-ndjson')
+    except Exception as e:
+        return _json({"error": f"Error streaming market data: {str(e)}"}, 500)
+
+def register_routes(app):
+    """Register all API routes with the Flask app"""
+    
+    # register authentication routes first
+    register_auth_routes(app)
+    
+    # module-level views registered with explicit endpoint names
+    app.add_url_rule('/', 'hello_world', hello_world)
+    app.add_url_rule('/end', 'signal_end', signal_end, methods=['POST'])
+    app.add_url_rule('/save-config', 'save_configuration', save_configuration, methods=['POST'])
+    app.add_url_rule('/status', 'get_status', get_status)
+    app.add_url_rule('/status-stream', 'stream_status', stream_status)
+    app.add_url_rule('/trades', 'get_recent_trades', get_recent_trades)
+    app.add_url_rule('/parameters', 'get_parameters', get_parameters)
+    app.add_url_rule('/market-data', 'get_market_data', get_market_data)
+    app.add_url_rule('/market-data-stream', 'stream_market_data', stream_market_data)
@@ -4,46 +4,87 @@ Enhanced security with pre-hashed passwords and reduced attack surface.
 
 Citations:
 - SHA-256 hashing: https://docs.python.org/3/library/hashlib.html
+- Constant-time comparison: https://docs.python.org/3/library/hmac.html#hmac.compare_digest
 - Flask decorators: https://flask.palletsprojects.com/en/2.3.x/patterns/viewdecorators/
 - Session management: https://docs.python.org/3/library/secrets.html
 - CSV file handling: https://docs.python.org/3/library/csv.html
+- Logging: https://docs.python.org/3/library/logging.html
 """
 
 import os
 import csv
+import hmac
+import logging
 import secrets
+import threading
 import time
 from functools import wraps
 from flask import request, jsonify
 
+# per-request auth events go through logging so they cost nothing when the level is off
+logger = logging.getLogger(__name__)
+
 # simple in-memory session store - tokens expire after 24 hours
+# reads are lock-free (dict.get is atomic under the GIL); all mutations hold _sessions_lock
 active_sessions = {}
+_sessions_lock = threading.Lock()
 SESSION_TIMEOUT = 24 * 60 * 60  # 24 hours in seconds
+SESSION_SWEEP_INTERVAL = 10 * 60  # purge expired sessions at most every 10 minutes
+_last_session_sweep = time.time()
+
+_BEARER = 'Bearer '  # Authorization header prefix for session tokens
+_BEARER_LEN = len(_BEARER)
 
 USER_CSV_PATH = "./dataframe/user.csv"
+_user_csv_initialized = False  # set once user.csv has been checked/created
+
+# parsed credentials cached per user.csv modification time
+_users_cache = None
+_users_mtime = None
+_users_lock = threading.Lock()
+
+def _sweep_expired_sessions(now):
+    """Drop expired tokens so the store doesn't grow without bound - caller holds _sessions_lock."""
+    global _last_session_sweep
+    if now - _last_session_sweep < SESSION_SWEEP_INTERVAL:
+        return
+    _last_session_sweep = now
+    for token, session in list(active_sessions.items()):
+        if now - session['created_at'] > SESSION_TIMEOUT:
+            del active_sessions[token]
 
 def create_session(username):
     """Create a new session token using cryptographically secure random generation."""
     token = secrets.token_urlsafe(32)  # generates secure random token
-    active_sessions[token] = {
-        'username': username,
-        'created_at': time.time()
-    }
+    now = time.time()
+    with _sessions_lock:
+        _sweep_expired_sessions(now)  # lazy GC piggybacks on logins
+        active_sessions[token] = {
+            'username': username,
+            'created_at': now
+        }
     return token
 
 def verify_session(token):
     """Check if session token is valid and hasn't expired."""
-    if token not in active_sessions:
+    session = active_sessions.get(token)
+    if session is None:
         return False
     
-    session = active_sessions[token]
     # check if session has expired
     if time.time() - session['created_at'] > SESSION_TIMEOUT:
-        del active_sessions[token]  # cleanup expired session
+        with _sessions_lock:
+            active_sessions.pop(token, None)  # cleanup expired session
         return False
     
     return True
 
+def end_session(token):
+    """Remove a session token and return its username, or None if it wasn't active."""
+    with _sessions_lock:
+        session = active_sessions.pop(token, None)
+    return session['username'] if session else None
+
 def require_auth(f):
     """
     Decorator to require authentication for Flask routes.
@@ -54,10 +95,10 @@ def require_auth(f):
         auth_header = request.headers.get('Authorization')
         
         # check for proper authorization header format
-        if not auth_header or not auth_header.startswith('Bearer '):
+        if not auth_header or not auth_header.startswith(_BEARER):
             return jsonify({'error': 'Authentication required'}), 401
         
-        token = auth_header.split(' ')[1]  # extract token from "Bearer <token>"
+        token = auth_header[_BEARER_LEN:]  # extract token from "Bearer <token>" without splitting
         if not verify_session(token):
             return jsonify({'error': 'Invalid or expired session'}), 401
         
@@ -65,7 +106,14 @@ def require_auth(f):
     return decorated_function
 
 def ensure_user_csv_exists():
-    """Create user.csv with secure default admin user if it doesn't exist."""
+    """
+    Create user.csv with secure default admin user if it doesn't exist.
+    Runs once per process - later calls (e.g. from every login) return immediately.
+    """
+    global _user_csv_initialized
+    if _user_csv_initialized:
+        return
+    
     dataframe_dir = os.path.dirname(USER_CSV_PATH)
     os.makedirs(dataframe_dir, exist_ok=True)  # create directory if needed
     
@@ -87,49 +135,79 @@ def ensure_user_csv_exists():
         print("   Password: [Secure - Check documentation]")
     else:
         print("📂 Using existing authentication file")
+    
+    _user_csv_initialized = True
 
 def load_user_credentials():
-    """Load user credentials from CSV with robust header handling."""
+    """
+    Load user credentials, re-reading user.csv only when its modification time changes.
+    Repeated logins reuse the parsed credentials instead of re-parsing the file.
+    """
+    global _users_cache, _users_mtime
     ensure_user_csv_exists()
     
+    try:
+        mtime = os.stat(USER_CSV_PATH).st_mtime_ns
+    except OSError:
+        mtime = None  # unreadable file - let the parser report the error
+    
+    with _users_lock:
+        if mtime is not None and _users_cache is not None and mtime == _users_mtime:
+            return _users_cache
+        
+        users = _read_user_credentials()
+        _users_cache, _users_mtime = users, mtime
+        return users
+
+def _is_sha256_hex(value):
+    """Check for a 64-char hex SHA-256 digest - bytes.fromhex does the character scan in C."""
+    if len(value) != 64:
+        return False
+    try:
+        return len(bytes.fromhex(value)) == 32  # fromhex skips spaces, so confirm the byte count
+    except ValueError:
+        return False
+
+def _read_user_credentials():
+    """Parse user credentials from CSV with robust header handling."""
     try:
         with open(USER_CSV_PATH, 'r', newline='', encoding='utf-8') as file:
             reader = csv.DictReader(file)
             users = {}
             
-            print(f"📂 Loading secure credentials...")
+            logger.debug("📂 Loading secure credentials...")
+            
+            # resolve username/password columns once (case insensitive, strip whitespace)
+            # handles potential whitespace in headers - common CSV issue
+            fieldnames = reader.fieldnames or []
+            username_key = next((key for key in fieldnames if key.strip().lower() == 'username'), None)
+            password_key = next((key for key in fieldnames if key.strip().lower() == 'password'), None)
+            if username_key is None or password_key is None:
+                logger.warning("⚠️ Missing username/password columns in headers: %s", fieldnames)
+                return {}
             
             for row in reader:
-                # handle potential whitespace in headers - common CSV issue
-                username = None
-                password_field = None
-                
-                # find username and password fields (case insensitive, strip whitespace)
-                for key, value in row.items():
-                    clean_key = key.strip().lower()
-                    if clean_key == 'username':
-                        username = value.strip()
-                    elif clean_key == 'password':
-                        password_field = value.strip()
+                username = (row[username_key] or '').strip()
+                password_field = (row[password_key] or '').strip()
                 
                 if not username or not password_field:
-                    print(f"⚠️ Skipping invalid row: {row}")
+                    logger.warning("⚠️ Skipping invalid row %d in user.csv", reader.line_num)  # row may hold a hash
                     continue
                 
-                print(f"👤 Authenticated user: {username}")
+                logger.debug("👤 Loaded user: %s", username)
                 
                 # password should already be hashed in CSV for security
-                if len(password_field) == 64 and all(c in '0123456789abcdef' for c in password_field.lower()):
+                if _is_sha256_hex(password_field):
                     users[username] = password_field
                 else:
-                    print(f"⚠️ Invalid hash format for user: {username}")
+                    logger.warning("⚠️ Invalid hash format for user: %s", username)
                     continue
             
-            print(f"📊 Authentication system ready: {len(users)} user(s)")
+            logger.debug("📊 Authentication system ready: %d user(s)", len(users))
             return users
             
     except Exception as e:
-        print(f"❌ Error loading credentials: {e}")
+        logger.error("❌ Error loading credentials: %s", e)
         return {}
 
 def register_auth_routes(app):
@@ -152,13 +230,15 @@ def register_auth_routes(app):
                     'message': 'Username and password required'
                 }), 400
             
-            print(f"🔐 Authentication attempt for user: {username}")
+            logger.debug("🔐 Authentication attempt for user: %s", username)
             users = load_user_credentials()
             
-            # verify credentials by comparing hashed passwords
-            if username in users and users[username] == password_hash:
+            # verify credentials by comparing hashed passwords in constant time
+            # (bytes so non-ASCII input is rejected cleanly instead of raising)
+            if (username in users and isinstance(password_hash, str) and
+                    hmac.compare_digest(users[username].encode('utf-8'), password_hash.encode('utf-8'))):
                 token = create_session(username)  # create new session
-                print(f"✅ User '{username}' authenticated successfully")
+                logger.debug("✅ User '%s' authenticated successfully", username)
                 
                 return jsonify({
                     'success': True,
@@ -167,14 +247,14 @@ def register_auth_routes(app):
                     'username': username
                 })
             else:
-                print(f"❌ Authentication failed for '{username}' - Invalid credentials")
+                logger.warning("❌ Authentication failed for '%s' - Invalid credentials", username)
                 return jsonify({
                     'success': False,
                     'message': 'Invalid username or password'
                 }), 401
                 
         except Exception as e:
-            print(f"❌ Authentication error: {e}")
+            logger.error("❌ Authentication error: %s", e)
             return jsonify({
                 'success': False,
                 'message': 'Server error'
@@ -188,14 +268,13 @@ def register_auth_routes(app):
         
         try:
             auth_header = request.headers.get('Authorization')
-            if auth_header and auth_header.startswith('Bearer '):
-                token = auth_header.split(' ')[1]
-                if token in active_sessions:
-                    username = active_sessions[token]['username']
-                    del active_sessions[token]  # remove session from memory
-                    print(f"👋 User '{username}' logged out")
+            if auth_header and auth_header.startswith(_BEARER):
+                token = auth_header[_BEARER_LEN:]
+                username = end_session(token)  # remove session from memory
+                if username:
+                    logger.debug("👋 User '%s' logged out", username)
             
             return jsonify({'success': True, 'message': 'Logged out'})
         except Exception as e:
-            print(f"Logout error: {e}")
+            logger.warning("Logout error: %s", e)
             return jsonify({'success': True, 'message': 'Logged out'})  # always return success for logout
\ No newline at end of file
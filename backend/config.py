@@ -9,7 +9,10 @@ Citations:
 - Parameter validation patterns: https://realpython.com/python-data-validation/
 """
 
-import os
+import threading
+from collections import deque
+from types import MappingProxyType
+from functools import lru_cache
 
 # API Configuration
 BINANCE_BASE_URL = "https://api.binance.com/api/v3"
@@ -19,9 +22,12 @@ SYMBOL = "BTCUSDT"  # trading pair - can be changed to any supported symbol
 CSV_FILE_PATH = "./dataframe/market_data.csv"
 THRESHOLD_CSV_PATH = "./dataframe/threshold.csv"
 ORDER_CSV_PATH = "./dataframe/order.csv"
+ORDER_SUMMARY_PATH = "./dataframe/order_summary.json"  # running trade counts kept alongside order.csv
 
 # Trading State Configuration
 CACHE_SIZE = 100  # keep last 100 records in memory for performance
+MARKET_DATA_FLUSH_ROWS = 10  # write buffered market data to CSV after this many ticks...
+MARKET_DATA_FLUSH_SECONDS = 600  # ...or once this many seconds have passed since the last write
 
 # Parameter Validation Ranges - ensures safe trading parameters
 # each parameter has min/max limits and recommended ranges for optimal performance
@@ -38,8 +44,21 @@ PARAMETER_RANGES = {
     'indicator_window': {'min': 10, 'max': 50, 'recommended': (20, 30)}  # periods for technical indicators
 }
 
+# flattened (min, max, rec_min, rec_max) per parameter - one lookup instead of nested dict access
+_RANGES_FLAT = {
+    name: (ranges['min'], ranges['max'], ranges['recommended'][0], ranges['recommended'][1])
+    for name, ranges in PARAMETER_RANGES.items()
+}
+
+# validation message templates - hard limit breaches warn, recommended range misses suggest
+_BELOW_MIN = "⚠️  {name}={value} is below minimum ({limit})"
+_ABOVE_MAX = "⚠️  {name}={value} is above maximum ({limit})"
+_BELOW_REC = "💡 {name}={value} is below recommended range ({rec_min}-{rec_max})"
+_ABOVE_REC = "💡 {name}={value} is above recommended range ({rec_min}-{rec_max})"
+
 # Default Trading Thresholds - optimized values based on backtesting and common practices
-DEFAULT_THRESHOLDS = {
+# read-only view - callers that need a writable config take dict(DEFAULT_THRESHOLDS)
+DEFAULT_THRESHOLDS = MappingProxyType({
     'trade_size': 0.01,  # 1% of portfolio per trade
     'stop_loss': 0.02,  # 2% stop loss - conservative risk management
     'stop_profit': 0.025,  # 2.5% take profit - slightly higher than stop loss
@@ -51,14 +70,16 @@ DEFAULT_THRESHOLDS = {
     'active': True,  # trading enabled by default
     'loop_interval': 60,  # check every minute
     'indicator_window': 26  # standard MACD slow period
-}
+})
 
 # Technical Indicator Configuration - all periods derived from main indicator_window
 # this unified approach ensures consistent indicator calculation across the system
+@lru_cache(maxsize=64)
 def get_indicator_periods(indicator_window):
     """
     Calculate all indicator periods based on the main indicator_window.
     Uses standard technical analysis ratios to derive optimal periods.
+    Results are memoized per window, so callers must treat the returned dict as read-only.
     """
     return {
         'rsi_window': max(10, int(indicator_window * 0.54)),  # ~14 when indicator_window=26 (standard RSI)
@@ -67,45 +88,64 @@ def get_indicator_periods(indicator_window):
         'signal_window': max(6, int(indicator_window * 0.35)) # ~9 when indicator_window=26 (standard signal line)
     }
 
+@lru_cache(maxsize=64)
+def get_min_required(indicator_window):
+    """Minimum candles before every indicator is available - the largest derived period."""
+    periods = get_indicator_periods(indicator_window)
+    return max(periods['rsi_window'], periods['macd_slow'], periods['signal_window'])
+
 def validate_parameter(param_name, value):
     """
     Validate a parameter value and return warnings if out of recommended range.
     Helps users understand if their settings might be risky or suboptimal.
     """
-    if param_name not in PARAMETER_RANGES:
-        return []
+    return list(_validate_parameter_cached(param_name, value))  # fresh list - callers may extend it
+
+@lru_cache(maxsize=1024, typed=True)  # typed so 1, 1.0 and True keep their own message text
+def _validate_parameter_cached(param_name, value):
+    """Memoized validate_parameter - thresholds rarely change, so most calls are cache hits."""
+    entry = _RANGES_FLAT.get(param_name)
+    if entry is None:
+        return ()
     
-    ranges = PARAMETER_RANGES[param_name]
-    warnings = []
+    min_value, max_value, rec_min, rec_max = entry
     
-    # check hard limits first - these could break the system
-    if value < ranges['min']:
-        warnings.append(f"⚠️  {param_name}={value} is below minimum ({ranges['min']})")
-    elif value > ranges['max']:
-        warnings.append(f"⚠️  {param_name}={value} is above maximum ({ranges['max']})")
+    # check hard limits first - these could break the system (and make range advice moot)
+    if value < min_value:
+        return (_BELOW_MIN.format(name=param_name, value=value, limit=min_value),)
+    if value > max_value:
+        return (_ABOVE_MAX.format(name=param_name, value=value, limit=max_value),)
     
     # check recommended range - these are optimization suggestions
-    rec_min, rec_max = ranges['recommended']
-    if ranges['min'] <= value <= ranges['max']:  # only check if within hard limits
-        if value < rec_min:
-            warnings.append(f"💡 {param_name}={value} is below recommended range ({rec_min}-{rec_max})")
-        elif value > rec_max:
-            warnings.append(f"💡 {param_name}={value} is above recommended range ({rec_min}-{rec_max})")
+    if value < rec_min:
+        return (_BELOW_REC.format(name=param_name, value=value, rec_min=rec_min, rec_max=rec_max),)
+    if value > rec_max:
+        return (_ABOVE_REC.format(name=param_name, value=value, rec_min=rec_min, rec_max=rec_max),)
     
-    return warnings
+    return ()
+
+# last (key, warnings) pair from validate_all_parameters - thresholds rarely change between loads
+_last_validation = (None, ())
 
 def validate_all_parameters(thresholds):
     """
     Validate all threshold parameters and return combined warnings.
     Includes both individual parameter validation and logical consistency checks.
     """
+    global _last_validation
+    
+    # 'active' is never validated; types are part of the key because they show up in the messages
+    key = tuple((name, type(value), value) for name, value in thresholds.items() if name != 'active')
+    last_key, last_warnings = _last_validation
+    if key == last_key:
+        return list(last_warnings)
+    
     all_warnings = []
     
-    # validate each parameter individually
+    # validate each parameter individually - straight to the shared cached helper, no per-param list
     for param_name, value in thresholds.items():
         if param_name != 'active':  # skip boolean parameter
-            warnings = validate_parameter(param_name, value)
-            all_warnings.extend(warnings)
+            all_warnings.extend(_validate_parameter_cached(param_name, value))
     
     # additional logic validation - check parameter relationships
     if thresholds['rsi_buy_threshold'] >= thresholds['rsi_sell_threshold']:
@@ -114,6 +154,7 @@ def validate_all_parameters(thresholds):
     if thresholds['stop_loss'] >= thresholds['stop_profit']:
         all_warnings.append("💡 Stop loss is higher than stop profit - consider adjusting")
     
+    _last_validation = (key, tuple(all_warnings))  # swapped as one tuple so readers never see a mixed pair
     return all_warnings
 
 class TradingState:
@@ -121,10 +162,45 @@ class TradingState:
     Global trading state management - handles system-wide state and data caching.
     Provides centralized access to trading status and historical data.
     """
+    # fixed field set - no per-instance __dict__, attribute access is a direct slot load
+    __slots__ = (
+        'ending', 'historical_data', 'cache_size', 'data_version', 'data_updated', 'stop_event',
+        'ema_fast', 'ema_slow', 'signal_ema', 'avg_gain', 'avg_loss', 'prev_price',
+        'indicator_count', 'indicator_periods', 'indicator_factors', 'indicator_version'
+    )
+
     def __init__(self):
         self.ending = False  # signal for graceful shutdown
-        self.historical_data = []  # keep historical completed candles in memory
-        self.cache_size = CACHE_SIZE  # limit memory usage
+        self.historical_data = deque(maxlen=CACHE_SIZE)  # recent completed candles - oldest evicted automatically
+        self.cache_size = CACHE_SIZE  # same bound as historical_data.maxlen
+        self.data_version = 0  # bumped on every new candle so listeners can detect changes
+        self.data_updated = threading.Condition()  # notified alongside data_version
+        self.stop_event = threading.Event()  # set on shutdown so waits end immediately
+
+        # running indicator state - advanced one step per candle instead of recomputing the window
+        self.ema_fast = None  # MACD fast EMA
+        self.ema_slow = None  # MACD slow EMA
+        self.signal_ema = None  # EMA of the MACD line
+        self.avg_gain = None  # Wilder-smoothed RSI gain
+        self.avg_loss = None  # Wilder-smoothed RSI loss
+        self.prev_price = None  # last price folded into the state
+        self.indicator_count = 0  # number of prices folded into the state
+        self.indicator_periods = None  # periods the state was built with
+        self.indicator_factors = None  # EMA/Wilder constants for indicator_periods
+        self.indicator_version = None  # data_version the state is in sync with
+
+    def request_stop(self):
+        """Signal graceful shutdown and wake anything waiting on the trading loop or status stream."""
+        self.ending = True
+        self.stop_event.set()
+        with self.data_updated:
+            self.data_updated.notify_all()
+
+    def notify_data_updated(self):
+        """Wake any status listeners after a new candle has been cached."""
+        with self.data_updated:
+            self.data_version += 1
+            self.data_updated.notify_all()
 
 # global trading state instance - singleton pattern for system-wide access
 trading_state = TradingState()
\ No newline at end of file
@@ -6,37 +6,37 @@ Citations:
 - Technical analysis indicator calculation: https://www.investopedia.com/terms/t/technicalindicator.asp
 - Time series data processing: https://pandas.pydata.org/docs/user_guide/timeseries.html
 - Data pipeline patterns: https://realpython.com/python-data-structures/
+- Logging: https://docs.python.org/3/library/logging.html
 """
 
-from file_manager import get_historical_data, append_to_csv
-from technical_indicators import calculate_technical_indicators
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+from config import get_indicator_periods, trading_state
+from file_manager import get_historical_data, append_to_csv, append_many_to_csv
+from technical_indicators import seed_indicator_state, update_indicators_incremental
+
+# per-tick save messages go through logging so formatting is skipped when INFO is off
+logger = logging.getLogger(__name__)
 
 def create_market_data_with_indicators(raw_data, indicator_window):
     """
     Create complete market data entry with pre-calculated indicators.
-    This approach ensures indicators are calculated consistently using historical context.
+    Indicators are advanced incrementally from the running state on trading_state.
     """
     if raw_data is None:
         return None
     
-    # get historical data needed for indicator calculation
-    historical_data = get_historical_data()
-    
-    # create temporary dataset that includes current data point for calculation
-    # this ensures indicators are calculated with the most recent price included
-    temp_historical_data = historical_data.copy()
-    current_data_point = {
-        'datetime': raw_data['datetime'],
-        'price': raw_data['price'],
-        'volume': raw_data['volume'],
-        'rsi': None,  # will be calculated using historical context
-        'macd': None,  # will be calculated using historical context
-        'signal_line': None  # will be calculated using historical context
-    }
-    temp_historical_data.append(current_data_point)
+    # running indicator state covers every cached candle as long as it is in sync with the cache
+    # (rebuilt from history on startup, window changes, or if the previous candle was never cached)
+    periods = get_indicator_periods(indicator_window)
+    if (trading_state.indicator_periods != periods or
+            trading_state.indicator_version != trading_state.data_version):
+        seed_indicator_state(trading_state, get_historical_data(), periods)
     
-    # calculate indicators using historical data + current point for accuracy
-    rsi, macd, signal_line = calculate_technical_indicators(temp_historical_data, indicator_window)
+    # advance indicators by one step with the current price instead of recomputing the window
+    rsi, macd, signal_line = update_indicators_incremental(trading_state, raw_data['price'], periods)
+    trading_state.indicator_version = trading_state.data_version + 1  # in sync once this candle is cached
     
     # create complete market data entry with all indicators populated
     market_data = {
@@ -50,6 +50,39 @@ def create_market_data_with_indicators(raw_data, indicator_window):
     
     return market_data
 
+def backfill_market_data(raw_points, indicator_window):
+    """
+    Append a batch of past candles (e.g. a startup /klines backfill) with one write.
+    Points not newer than the latest cached candle are skipped, and indicators are advanced
+    point by point on a scratch state so each row matches what the live loop would have stored.
+    Returns the number of rows added.
+    """
+    historical_data = get_historical_data()
+    if historical_data:
+        last_seen = datetime.fromisoformat(historical_data[-1]['datetime'])
+        raw_points = [point for point in raw_points if datetime.fromisoformat(point['datetime']) > last_seen]
+    if not raw_points:
+        return 0
+    
+    periods = get_indicator_periods(indicator_window)
+    state = SimpleNamespace()  # trading_state reseeds itself on the next tick (data_version moves on)
+    seed_indicator_state(state, historical_data, periods)
+    
+    rows = []
+    for point in raw_points:
+        rsi, macd, signal_line = update_indicators_incremental(state, point['price'], periods)
+        rows.append({
+            'datetime': point['datetime'],
+            'price': point['price'],
+            'volume': point['volume'],
+            'rsi': rsi,
+            'macd': macd,
+            'signal_line': signal_line
+        })
+    
+    append_many_to_csv(rows)
+    return len(rows)
+
 def save_market_data(market_data):
     """
     Save complete market data (including pre-calculated indicators) to CSV.
@@ -62,19 +95,22 @@ def save_market_data(market_data):
         # persist data to CSV file for historical analysis
         append_to_csv(market_data)
         
-        # create human-readable indicators info for logging
-        indicators_info = ""
-        if market_data['rsi'] is not None:
-            indicators_info += f" | RSI: {market_data['rsi']:.2f}"  # 2 decimal places for readability
-        if market_data['macd'] is not None:
-            indicators_info += f" | MACD: {market_data['macd']:.6f}"  # 6 decimal places for precision
-        if market_data['signal_line'] is not None:
-            indicators_info += f" | Signal: {market_data['signal_line']:.6f}"  # 6 decimal places for precision
+        # build human-readable indicators info only when it will actually be logged
+        if logger.isEnabledFor(logging.INFO):
+            indicators_info = ""
+            if market_data['rsi'] is not None:
+                indicators_info += f" | RSI: {market_data['rsi']:.2f}"  # 2 decimal places for readability
+            if market_data['macd'] is not None:
+                indicators_info += f" | MACD: {market_data['macd']:.6f}"  # 6 decimal places for precision
+            if market_data['signal_line'] is not None:
+                indicators_info += f" | Signal: {market_data['signal_line']:.6f}"  # 6 decimal places for precision
+            
+            # log successful save with price, volume, and indicator values
+            logger.info("Market data saved: Price=%s, Volume=%s%s",
+                        market_data['price'], market_data['volume'], indicators_info)
         
-        # log successful save with price, volume, and indicator values
-        print(f"Market data saved: Price={market_data['price']}, Volume={market_data['volume']}{indicators_info}")
         return True
         
     except Exception as e:
-        print(f"Error saving market data: {e}")
+        logger.error("Error saving market data: %s", e)
         return False
\ No newline at end of file
@@ -4,20 +4,30 @@ Handles all CSV file operations and data persistence with parameter validation.
 
 Citations:
 - CSV file handling: https://docs.python.org/3/library/csv.html
-- Pandas data manipulation: https://pandas.pydata.org/docs/
-- NumPy NaN handling: https://numpy.org/doc/stable/reference/generated/numpy.isnan.html
+- NaN comparison semantics: https://docs.python.org/3/reference/expressions.html#value-comparisons
 - File system operations: https://docs.python.org/3/library/os.html
 """
 
 import csv
+import json
+import logging
 import os
-import pandas as pd
-import numpy as np
+import threading
+import tempfile
+import time
+import atexit
 from config import (
-    CSV_FILE_PATH, THRESHOLD_CSV_PATH, ORDER_CSV_PATH, 
+    CSV_FILE_PATH, THRESHOLD_CSV_PATH, ORDER_CSV_PATH, ORDER_SUMMARY_PATH,
+    MARKET_DATA_FLUSH_ROWS, MARKET_DATA_FLUSH_SECONDS,
     DEFAULT_THRESHOLDS, trading_state, validate_all_parameters
 )
 
+# per-event messages go through logging - startup banners stay as prints
+logger = logging.getLogger(__name__)
+
+# market_data.csv column order - shared by the header and every appended row
+MARKET_DATA_FIELDS = ('datetime', 'price', 'volume', 'rsi', 'macd', 'signal_line')
+
 def ensure_csv_exists():
     """Ensure the CSV file exists with proper headers for market data storage."""
     dataframe_dir = os.path.dirname(CSV_FILE_PATH)
@@ -28,7 +38,7 @@ def ensure_csv_exists():
         # create file with proper column headers for all data types
         with open(CSV_FILE_PATH, 'w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
-            writer.writerow(['datetime', 'price', 'volume', 'rsi', 'macd', 'signal_line'])
+            writer.writerow(MARKET_DATA_FIELDS)
     else:
         print(f"Using existing market_data.csv file at {CSV_FILE_PATH}")
 
@@ -80,7 +90,37 @@ def ensure_order_csv_exists():
     else:
         print(f"Using existing order.csv file at {ORDER_CSV_PATH}")
 
+# parsed thresholds cached per threshold.csv (mtime, size) - the trading loop asks every iteration
+_thresholds_file_cache = {'key': None, 'value': None}
+_thresholds_file_lock = threading.Lock()
+
 def load_trading_thresholds():
+    """
+    Load trading thresholds, re-parsing and re-validating threshold.csv only when it changes.
+    The returned dict is shared between callers, so treat it as read-only.
+    """
+    try:
+        stat = os.stat(THRESHOLD_CSV_PATH)
+        key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = None  # missing file - recreated with defaults below
+    
+    with _thresholds_file_lock:
+        if key is not None and key == _thresholds_file_cache['key']:
+            return _thresholds_file_cache['value']
+        
+        thresholds = _parse_trading_thresholds()
+        if key is not None:
+            _thresholds_file_cache['key'] = key
+            _thresholds_file_cache['value'] = thresholds
+        return thresholds
+
+def invalidate_trading_thresholds():
+    """Force the next load to re-parse - a rewrite can land within the same mtime tick."""
+    with _thresholds_file_lock:
+        _thresholds_file_cache['key'] = None
+
+def _parse_trading_thresholds():
     """
     Load trading thresholds from CSV file with validation and warnings.
     Includes comprehensive error handling and parameter validation.
@@ -115,195 +155,463 @@ def load_trading_thresholds():
                     config['indicator_window'] = int(float(threshold.get('indicator_window', 26)))
                     
                 except (ValueError, KeyError) as e:
-                    print(f"⚠️  Error parsing threshold parameter: {e}")
-                    print("Using default values for invalid parameters")
-                    config = DEFAULT_THRESHOLDS.copy()
+                    logger.warning("⚠️  Error parsing threshold parameter: %s - using default values", e)
+                    config = dict(DEFAULT_THRESHOLDS)
                 
                 # validate parameters and display warnings to help users optimize settings
                 warnings = validate_all_parameters(config)
                 if warnings:
-                    print("\n" + "="*50)
-                    print("🔍 PARAMETER VALIDATION WARNINGS:")
-                    print("="*50)
-                    for warning in warnings:
-                        print(warning)
-                    print("="*50 + "\n")
+                    logger.warning("🔍 PARAMETER VALIDATION WARNINGS:\n%s", "\n".join(warnings))
                 
                 return config
             else:
-                print("No thresholds found in CSV, using defaults")
-                return DEFAULT_THRESHOLDS
+                logger.warning("No thresholds found in CSV, using defaults")
+                return dict(DEFAULT_THRESHOLDS)  # writable copy - the defaults are read-only
                 
     except Exception as e:
-        print(f"Error loading thresholds: {e}")
-        return DEFAULT_THRESHOLDS
+        logger.error("Error loading thresholds: %s", e)
+        return dict(DEFAULT_THRESHOLDS)
 
 def get_current_position_from_orders():
     """
-    Get current position by analyzing the order history.
-    Calculates net position by counting buy vs sell orders.
+    Get current position from the running buy/sell counts in the order summary.
+    Net position is the buy vs sell imbalance, priced at the most recent order - no order.csv scan.
     """
     try:
         if not os.path.exists(ORDER_CSV_PATH):
             return None, None
         
-        with open(ORDER_CSV_PATH, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            orders = list(reader)
-        
-        if not orders:
-            return None, None
-        
-        # get the most recent order for price reference
-        last_order = orders[-1]
-        
-        # calculate net position by counting orders
-        buy_count = sum(1 for order in orders if order['side'] == 'BUY')
-        sell_count = sum(1 for order in orders if order['side'] == 'SELL')
+        summary = load_order_summary()
+        buy_count = summary['buy_trades']
+        sell_count = summary['sell_trades']
         
         # determine current position based on order imbalance
         if buy_count > sell_count:
-            return 'LONG', float(last_order['price'])
+            return 'LONG', float(summary['last_price'])
         elif sell_count > buy_count:
-            return 'SHORT', float(last_order['price'])
+            return 'SHORT', float(summary['last_price'])
         else:
             return None, None  # no net position
             
     except Exception as e:
-        print(f"Error reading current position from orders: {e}")
+        logger.error("Error reading current position from orders: %s", e)
         return None, None
 
+# in-memory copy of the order summary sidecar - valid while order.csv keeps the size it records
+# (read and replaced only under _order_summary_lock)
+_order_summary_cache = None
+
+# serializes sidecar rebuilds/writes and the "append order + update summary" sequence, so a
+# Flask thread never rebuilds from order.csv while the trading thread is between the two writes
+# (reentrant - append_order_to_csv loads the summary while holding it)
+_order_summary_lock = threading.RLock()
+
+def _write_order_summary(summary):
+    """
+    Write the order summary sidecar atomically so readers never see a partial file.
+    Each write gets its own temp file, so concurrent writers can't replace each other's.
+    Caller holds _order_summary_lock, which also guards the in-memory copy updated here.
+    """
+    global _order_summary_cache
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(ORDER_SUMMARY_PATH), prefix='order_summary.', suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(summary, file)
+        os.replace(temp_path, ORDER_SUMMARY_PATH)
+    except BaseException:
+        os.unlink(temp_path)  # don't leave a stray temp file behind on failure
+        raise
+    _order_summary_cache = summary
+
+def _rebuild_order_summary():
+    """
+    Rebuild the order summary by scanning the full order history once.
+    Only needed when the sidecar is missing or out of sync with order.csv.
+    """
+    summary = {'total_trades': 0, 'buy_trades': 0, 'sell_trades': 0, 'last_price': None, 'file_size': 0}
+    
+    if os.path.exists(ORDER_CSV_PATH):
+        with open(ORDER_CSV_PATH, 'r', newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            # resolve column positions from the header once (stray whitespace tolerated)
+            columns = {name.strip(): index for index, name in enumerate(next(reader, []))}
+            side_i = columns.get('side', 1)
+            price_i = columns.get('price', 2)
+            for row in reader:
+                if len(row) <= side_i:
+                    continue  # skip blank or malformed lines
+                summary['total_trades'] += 1
+                side = row[side_i].strip()
+                if side == 'BUY':
+                    summary['buy_trades'] += 1
+                elif side == 'SELL':
+                    summary['sell_trades'] += 1
+                if len(row) > price_i:
+                    summary['last_price'] = row[price_i].strip()  # most recent order price for position reference
+        summary['file_size'] = os.path.getsize(ORDER_CSV_PATH)
+    
+    _write_order_summary(summary)
+    return summary
+
+def load_order_summary():
+    """
+    Get total/buy/sell trade counts and the last order price without scanning order.csv.
+    The sidecar records the order file size it describes, so a manual edit triggers a rebuild.
+    While the size still matches, the in-memory copy is returned - callers must not mutate it.
+    """
+    global _order_summary_cache
+    with _order_summary_lock:
+        # size and cache are checked under the lock - an order append is never half-seen
+        current_size = os.path.getsize(ORDER_CSV_PATH) if os.path.exists(ORDER_CSV_PATH) else 0
+        
+        cached = _order_summary_cache
+        if cached is not None and cached['file_size'] == current_size:
+            return cached  # one stat per call instead of re-reading the sidecar every tick
+        
+        try:
+            with open(ORDER_SUMMARY_PATH, 'r', encoding='utf-8') as file:
+                summary = json.load(file)
+            if summary.get('file_size') == current_size and 'last_price' in summary:
+                _order_summary_cache = summary
+                return summary  # sidecars written before last_price was tracked get rebuilt
+        except (OSError, ValueError):
+            pass  # missing or corrupt sidecar - fall through to rebuild
+        
+        return _rebuild_order_summary()
+
+_order_columns_cache = None  # order.csv header never changes once the file exists
+
+def get_order_columns():
+    """
+    Map order CSV column names to their positions, reading the header only once.
+    Strips stray whitespace around names so positional lookups work with hand-edited headers.
+    """
+    global _order_columns_cache
+    if _order_columns_cache is None:
+        with open(ORDER_CSV_PATH, 'r', newline='', encoding='utf-8') as file:
+            header = next(csv.reader(file), [])
+        _order_columns_cache = {name.strip(): index for index, name in enumerate(header)}
+    return _order_columns_cache
+
+def read_recent_orders(limit=20, tail_bytes=65536):
+    """
+    Read only the last `limit` orders by seeking to the end of order.csv.
+    Avoids parsing the whole order history when only the most recent trades are needed.
+    Rows are returned as positional lists - use get_order_columns() to locate fields.
+    Order rows are ISO datetimes and plain numbers with no quoting, so a plain comma split is safe.
+    """
+    if not os.path.exists(ORDER_CSV_PATH):
+        return []
+    
+    with open(ORDER_CSV_PATH, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        start = max(0, size - tail_bytes)
+        file.seek(start)
+        lines = file.read().decode('utf-8').splitlines()
+    
+    # first line is either the header or a partial row cut by the seek
+    lines = [line for line in lines[1:] if line.strip()]
+    
+    return [line.split(',') for line in lines[-limit:]]
+
 def append_order_to_csv(order_data):
     """Append a trade order to the order CSV file for permanent record keeping."""
-    ensure_order_csv_exists()
+    if not os.path.exists(ORDER_CSV_PATH):
+        ensure_order_csv_exists()
     
     try:
-        with open(ORDER_CSV_PATH, 'a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file, lineterminator='\n')  # explicit line terminator for consistency
-            writer.writerow([
-                order_data['datetime'],
-                order_data['side'],
-                order_data['price'],
-                order_data['quantity'],
-                order_data['trade_size']
-            ])
-            file.flush()  # ensure data is written immediately
+        # row append and summary update happen as one step - readers never rebuild in between
+        with _order_summary_lock:
+            # load counts before appending so the sidecar size check still matches
+            summary = dict(load_order_summary())  # copy - the cached summary is shared with readers
+            
+            # one unbuffered append - the row reaches the OS immediately
+            _append_bytes(ORDER_CSV_PATH, (
+                f"{order_data['datetime']},{order_data['side']},{order_data['price']},"
+                f"{order_data['quantity']},{order_data['trade_size']}\n"
+            ).encode('utf-8'))
+            
+            # keep running trade counts in sync with the new row
+            summary['total_trades'] += 1
+            if order_data['side'] == 'BUY':
+                summary['buy_trades'] += 1
+            elif order_data['side'] == 'SELL':
+                summary['sell_trades'] += 1
+            summary['last_price'] = order_data['price']
+            summary['file_size'] = os.path.getsize(ORDER_CSV_PATH)
+            _write_order_summary(summary)
         
-        print(f"Order logged: {order_data['side']} {order_data['quantity']:.6f} at {order_data['price']}")
+        logger.info("Order logged: %s %.6f at %s", order_data['side'], order_data['quantity'], order_data['price'])
         
     except Exception as e:
-        print(f"Error appending order to CSV: {e}")
+        logger.error("Error appending order to CSV: %s", e)
 
-def parse_csv_row(row):
+def _market_data_indices(fieldnames):
     """
-    Parse a CSV row and convert numeric fields with robust error handling.
+    Resolve market data column positions from a header once, in MARKET_DATA_FIELDS order.
+    Raises KeyError if a required column is missing.
+    """
+    columns = {name.strip(): index for index, name in enumerate(fieldnames)}
+    return tuple(columns[field] for field in MARKET_DATA_FIELDS)
+
+def _safe_float(value):
+    """Safely convert string to float, handling empty/invalid values."""
+    if value and value != 'nan':
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+    return None
+
+def parse_csv_row(row, indices, _float=float, _safe_float=_safe_float):
+    """
+    Parse a positional CSV row and convert numeric fields with robust error handling.
     Handles various data type issues that can occur with CSV files.
+    Returns None for rows that can't be parsed so callers can skip them.
+    Converters are bound as default args so the per-row lookups stay local.
     """
     try:
-        def safe_float(value):
-            """safely convert string to float, handling empty/invalid values"""
-            if value and value != '' and value != 'nan':
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    return None
-            return None
-        
+        datetime_i, price_i, volume_i, rsi_i, macd_i, signal_i = indices
         return {
-            'datetime': row['datetime'],
-            'price': float(row['price']),  # price is always required
-            'volume': float(row['volume']),  # volume is always required
-            'rsi': safe_float(row['rsi']),  # indicators can be None during initial data collection
-            'macd': safe_float(row['macd']),
-            'signal_line': safe_float(row['signal_line'])
+            'datetime': row[datetime_i],
+            'price': _float(row[price_i]),  # price is always required
+            'volume': _float(row[volume_i]),  # volume is always required
+            'rsi': _safe_float(row[rsi_i]),  # indicators can be None during initial data collection
+            'macd': _safe_float(row[macd_i]),
+            'signal_line': _safe_float(row[signal_i])
         }
-    except (ValueError, TypeError) as e:
-        print(f"Error parsing CSV row: {e}")
-        return row  # return original row if parsing fails
+    except (ValueError, TypeError, IndexError) as e:
+        logger.warning("Error parsing CSV row: %s", e)
+        return None  # skip malformed rows rather than caching raw strings
 
 def format_indicator_value(value):
     """Format indicator value for CSV output, handling None and NaN values properly."""
-    if value is None or pd.isna(value):
+    # NaN is the only value not equal to itself - no math.isnan call needed
+    if value is None or value != value:
         return ''  # empty string for missing values
-    try:
-        if np.isnan(value):  # handle numpy NaN values
-            return ''
-    except (TypeError, ValueError):
-        pass  # value is not a numpy type
     return str(value)
 
+# paths already confirmed to end with a newline - later appends always end with one themselves
+_newline_checked = set()
+
+def _append_bytes(path, data):
+    """
+    Append data to an existing file with a single O_APPEND write - no Python file object or buffering.
+    The first append to a path checks its last byte, so a hand-edited file without a final newline
+    doesn't get the new row glued onto its last line. Loops only in the rare case the kernel
+    accepts a partial write. Returns the number of bytes written.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_APPEND)
+    try:
+        if path not in _newline_checked:
+            if os.fstat(fd).st_size:
+                # lseek + read rather than pread, which Windows lacks - O_APPEND writes still go to the end
+                os.lseek(fd, -1, os.SEEK_END)
+                if os.read(fd, 1) != b'\n':
+                    data = b'\n' + data
+            _newline_checked.add(path)
+        
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    return len(data)
+
+# market data rows waiting to be written - flushed in batches to amortize file opens
+_pending_rows = []
+_pending_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+# market_data.csv data rows on disk, and the file size that count describes - guarded by _pending_lock
+# a size that doesn't match means the file changed outside this process, so it gets recounted
+_disk_row_count = None
+_disk_size = None
+
+def flush_market_data():
+    """
+    Write all buffered market data rows to CSV in a single append.
+    Called when the buffer is due and on shutdown so no ticks are lost.
+    Holds the buffer lock for the write so row counts never see rows in flight.
+    """
+    global _last_flush, _disk_row_count, _disk_size
+    with _pending_lock:
+        _last_flush = time.monotonic()
+        if not _pending_rows:
+            return
+        
+        # only bootstrap the file when it's missing - avoids a directory check and log line every flush
+        if not os.path.exists(CSV_FILE_PATH):
+            ensure_csv_exists()
+        
+        data = ''.join(_pending_rows).encode('utf-8')
+        written = _append_bytes(CSV_FILE_PATH, data)  # on error the rows stay buffered for the next flush
+        
+        # advance the on-disk count by what we wrote - the file size now identifies it
+        if _disk_row_count is not None:
+            _disk_row_count += len(_pending_rows)
+            _disk_size += written
+        _pending_rows.clear()
+
+def _format_market_data_row(market_data):
+    """Format one market data CSV line - fixed schema of ISO timestamps and plain numbers, no quoting needed."""
+    return (f"{market_data['datetime']},{market_data['price']},{market_data['volume']},"
+            f"{format_indicator_value(market_data['rsi'])},"  # handle None/NaN properly
+            f"{format_indicator_value(market_data['macd'])},"
+            f"{format_indicator_value(market_data['signal_line'])}\n")
+
 def append_to_csv(market_data):
     """
     Append a single row of market data to CSV file with proper formatting.
-    Updates both file storage and in-memory cache for performance.
+    Rows are buffered and written every MARKET_DATA_FLUSH_ROWS ticks or MARKET_DATA_FLUSH_SECONDS,
+    while the in-memory cache is updated immediately.
     """
-    ensure_csv_exists()
+    row = _format_market_data_row(market_data)
     
     try:
-        with open(CSV_FILE_PATH, 'a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file, lineterminator='\n')
-            writer.writerow([
-                market_data['datetime'],
-                market_data['price'],
-                market_data['volume'],
-                format_indicator_value(market_data['rsi']),  # handle None/NaN properly
-                format_indicator_value(market_data['macd']),
-                format_indicator_value(market_data['signal_line'])
-            ])
-            file.flush()  # ensure immediate write to disk
+        with _pending_lock:
+            _pending_rows.append(row)
+            flush_due = (len(_pending_rows) >= MARKET_DATA_FLUSH_ROWS or
+                         time.monotonic() - _last_flush >= MARKET_DATA_FLUSH_SECONDS)
+        if flush_due:
+            flush_market_data()
         
         # update in-memory cache for fast access
         update_historical_cache(market_data)
         
     except Exception as e:
-        print(f"Error appending to CSV: {e}")
+        logger.error("Error appending to CSV: %s", e)
         raise
 
+def append_many_to_csv(rows):
+    """
+    Append a batch of market data rows (e.g. a backfill) with one write, then update the cache once.
+    Anything already buffered is written first so rows stay in chronological order.
+    """
+    global _disk_row_count, _disk_size
+    if not rows:
+        return
+    
+    flush_market_data()
+    
+    with _pending_lock:
+        if not os.path.exists(CSV_FILE_PATH):
+            ensure_csv_exists()
+        
+        data = ''.join(_format_market_data_row(row) for row in rows).encode('utf-8')
+        written = _append_bytes(CSV_FILE_PATH, data)
+        
+        if _disk_row_count is not None:
+            _disk_row_count += len(rows)
+            _disk_size += written
+    
+    # bulk cache update - the deque keeps only the newest cache_size rows
+    trading_state.historical_data.extend(rows)
+    trading_state.notify_data_updated()
+
+atexit.register(flush_market_data)  # drain buffered rows on normal interpreter exit
+
 def update_historical_cache(market_data):
     """
     Update the historical data cache with new completed candle.
-    Maintains fixed cache size for memory efficiency.
+    Cache size is fixed by the deque's maxlen, so the oldest candle drops off automatically.
+    The entry from create_market_data_with_indicators is already typed, so it is cached as-is
+    rather than re-parsed into a second dict.
     """
-    parsed_data = parse_csv_row(market_data)
-    trading_state.historical_data.append(parsed_data)
+    trading_state.historical_data.append(market_data)
+    trading_state.notify_data_updated()  # push the new candle to status stream listeners
+
+def _read_market_data_tail(limit, tail_bytes=65536):
+    """
+    Read the last `limit` market data rows by seeking back from the end of market_data.csv.
+    The read window doubles until it holds enough rows, so older history is never read or parsed.
+    Returns (fieldnames, rows) with rows as positional lists.
+    """
+    with open(CSV_FILE_PATH, 'rb') as file:
+        fieldnames = next(csv.reader([file.readline().decode('utf-8')]), [])
+        data_start = file.tell()
+        size = file.seek(0, os.SEEK_END)
+        
+        while True:
+            start = max(data_start, size - tail_bytes)
+            file.seek(start)
+            lines = file.read(size - start).decode('utf-8', errors='replace').splitlines()
+            if start > data_start:
+                lines = lines[1:]  # first line may be a partial row cut by the seek
+            lines = [line for line in lines if line.strip()]
+            if len(lines) >= limit or start == data_start:
+                break
+            tail_bytes *= 2
     
-    # keep only the last cache_size records to prevent memory bloat
-    if len(trading_state.historical_data) > trading_state.cache_size:
-        trading_state.historical_data = trading_state.historical_data[-trading_state.cache_size:]
+    return fieldnames, list(csv.reader(lines[-limit:]))
+
+def _count_data_rows(path, chunk_size=1 << 20):
+    """Count data rows (lines minus header) with bytes.count over large chunks - no per-line objects."""
+    lines = 0
+    last_byte = b'\n'
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            lines += chunk.count(b'\n')
+            last_byte = chunk[-1:]
+    if last_byte != b'\n':
+        lines += 1  # final row without a trailing newline
+    return max(0, lines - 1)
 
 def load_historical_data():
     """
     Load historical data from CSV file into cache on startup.
     Provides fast access to recent data for indicator calculations.
+    Only the tail of the file is read - the row count is taken lazily by get_row_count.
     """
     ensure_csv_exists()
     
     try:
-        with open(CSV_FILE_PATH, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            data = [parse_csv_row(row) for row in reader]
-            
-            # keep only recent data to optimize memory usage
-            trading_state.historical_data = data[-trading_state.cache_size:] if len(data) > trading_state.cache_size else data
-            print(f"Loaded {len(trading_state.historical_data)} historical records into cache")
+        fieldnames, rows = _read_market_data_tail(trading_state.cache_size)
+        _reset_row_count()  # history may have changed on disk - recount on first request
+        
+        trading_state.historical_data.clear()
+        indices = _market_data_indices(fieldnames)  # positional access - no per-row dict from the reader
+        parsed_rows = (parse_csv_row(row, indices) for row in rows)
+        trading_state.historical_data.extend(row for row in parsed_rows if row is not None)
+        print(f"Loaded {len(trading_state.historical_data)} historical records into cache")
             
     except Exception as e:
-        print(f"Error loading historical data: {e}")
-        trading_state.historical_data = []
+        logger.error("Error loading historical data: %s", e)
+        trading_state.historical_data.clear()
 
 def get_historical_data():
     """Get historical completed candles for indicator calculation - provides cached access."""
     return trading_state.historical_data
 
+def _reset_row_count():
+    """Forget the on-disk row count so the next get_row_count recounts the file."""
+    global _disk_row_count, _disk_size
+    with _pending_lock:
+        _disk_row_count = None
+        _disk_size = None
+
 def get_row_count():
-    """Get the number of data rows efficiently without loading all data into memory."""
-    if os.path.exists(CSV_FILE_PATH):
+    """
+    Get the number of data rows, including ticks still buffered in memory.
+    O(1) plus a stat - the file is only rescanned if its size no longer matches the known count.
+    """
+    global _disk_row_count, _disk_size
+    with _pending_lock:
+        try:
+            size = os.path.getsize(CSV_FILE_PATH)
+        except OSError:
+            return len(_pending_rows)  # nothing on disk yet
         try:
-            with open(CSV_FILE_PATH, 'r', newline='', encoding='utf-8') as file:
-                return sum(1 for _ in file) - 1  # subtract 1 for header row
+            if _disk_row_count is None or size != _disk_size:
+                _disk_row_count = _count_data_rows(CSV_FILE_PATH)  # header excluded
+                _disk_size = size
+            return _disk_row_count + len(_pending_rows)
         except Exception:
             return len(trading_state.historical_data)  # fallback to cached count
-    return 0
 
 def create_parameter_summary():
     """
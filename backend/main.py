@@ -5,17 +5,42 @@ Citations:
 - Flask application factory pattern: https://flask.palletsprojects.com/en/2.3.x/patterns/appfactories/
 - Background threading in Python: https://docs.python.org/3/library/threading.html
 - Application startup patterns: https://realpython.com/python-application-layouts/
+- Queue-based logging: https://docs.python.org/3/howto/logging-cookbook.html#dealing-with-handlers-that-block
 """
 
+import sys
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from api_routes import create_app, register_routes
 from trading_bot import start_background_trading
 from auth import ensure_user_csv_exists
 
+def configure_logging():
+    """
+    Route all log records through a queue drained by a background listener thread.
+    The trading loop only enqueues records - formatting and stdout writes happen off its path.
+    """
+    log_queue = queue.Queue(-1)  # unbounded - enqueueing never blocks the producer
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))  # same plain output the old prints gave
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, console, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drain remaining records on exit
+
 def main():
     """
     Main application entry point - orchestrates the startup of both web interface and trading engine.
     Follows a structured startup sequence to ensure all components are properly initialized.
     """
+    configure_logging()  # first, so every later log record reaches the console
+    
     print("🚀 Starting Crypto Trading Bot with Secure Authentication...")
     print("="*60)
     
@@ -9,31 +9,43 @@ Citations:
 - Error handling patterns: https://realpython.com/python-exceptions/
 """
 
+import time
+import logging
+import orjson
 import requests
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import BINANCE_BASE_URL, SYMBOL
 
+logger = logging.getLogger(__name__)
+
+# shared session keeps the TLS connection to Binance alive between polls
+SESSION = requests.Session()
+SESSION.headers.update({'Accept': 'application/json'})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3)  # retry transient connection failures
+))
+
+# kline intervals closest to the bot's loop_interval range (30-300 seconds)
+_KLINE_INTERVALS = ((60, '1m'), (180, '3m'), (300, '5m'))
+
 def fetch_binance_data():
     """
-    Fetches current market data from Binance API using two separate endpoints.
-    Combines price and volume data to create a complete market snapshot.
+    Fetches current market data from Binance API using the 24hr ticker endpoint.
+    A single response carries both the last traded price and 24-hour volume.
     """
     try:    
-        # fetch current price using ticker endpoint - most reliable for real-time pricing
-        ticker_url = f"{BINANCE_BASE_URL}/ticker/price"
+        # 24hr ticker stats include lastPrice, so one request covers price and volume
+        stats_url = f"{BINANCE_BASE_URL}/ticker/24hr"
         params = {"symbol": SYMBOL}  # specify trading pair (e.g., BTCUSDT)
         
-        response = requests.get(ticker_url, params=params, timeout=10)  # 10 second timeout prevents hanging
-        response.raise_for_status()  # raises exception for HTTP error codes
-        
-        data = response.json()
-        current_price = float(data['price'])  # convert string price to float
+        stats_response = SESSION.get(stats_url, params=params, timeout=10)  # 10 second timeout prevents hanging
+        stats_response.raise_for_status()  # raises exception for HTTP error codes
+        stats_data = orjson.loads(stats_response.content)  # parse raw bytes - skips the str decode
         
-        # fetch volume from 24hr ticker stats - provides trading activity context
-        stats_url = f"{BINANCE_BASE_URL}/ticker/24hr"
-        stats_response = requests.get(stats_url, params=params, timeout=10)
-        stats_response.raise_for_status()
-        stats_data = stats_response.json()
+        current_price = float(stats_data['lastPrice'])  # convert string price to float
         volume = float(stats_data['volume'])  # 24-hour trading volume
         
         # return structured data with ISO timestamp for consistency
@@ -45,9 +57,50 @@ def fetch_binance_data():
         
     except requests.exceptions.RequestException as e:
         # handle network-related errors (connection issues, timeouts, HTTP errors)
-        print(f"Error fetching Binance data: {e}")
+        logger.error("Error fetching Binance data: %s", e)
         return None
     except Exception as e:
         # catch any other unexpected errors (JSON parsing, type conversion, etc.)
-        print(f"Unexpected error in fetch_binance_data: {e}")
-        return None
\ No newline at end of file
+        logger.error("Unexpected error in fetch_binance_data: %s", e)
+        return None
+
+def kline_interval_for(loop_interval):
+    """Pick the Binance kline interval closest to the trading loop's polling interval."""
+    return min(_KLINE_INTERVALS, key=lambda item: abs(item[0] - loop_interval))[1]
+
+def fetch_binance_klines(interval, limit):
+    """
+    Fetches the most recent closed candles in a single /klines request - used to backfill history at startup.
+    Returns dicts shaped like fetch_binance_data (oldest first), stamped with each candle's close time.
+    Volume is the current rolling 24-hour figure from the ticker, so backfilled rows match the live ones.
+    """
+    ticker = fetch_binance_data()  # per-candle volume would mix units with the live 24h column
+    if ticker is None:
+        return None
+    
+    try:
+        klines_url = f"{BINANCE_BASE_URL}/klines"
+        params = {"symbol": SYMBOL, "interval": interval, "limit": limit + 1}  # +1 for the still-open candle
+        
+        klines_response = SESSION.get(klines_url, params=params, timeout=10)
+        klines_response.raise_for_status()
+        klines = orjson.loads(klines_response.content)
+        
+        # each kline is [open_time, open, high, low, close, volume, close_time, ...] - times in ms
+        now_ms = time.time() * 1000
+        return [
+            {
+                'datetime': datetime.fromtimestamp(kline[6] / 1000).isoformat(),
+                'price': float(kline[4]),  # close price
+                'volume': ticker['volume']
+            }
+            for kline in klines
+            if kline[6] < now_ms  # skip the candle that is still forming
+        ]
+        
+    except requests.exceptions.RequestException as e:
+        logger.error("Error fetching Binance klines: %s", e)
+        return None
+    except Exception as e:
+        logger.error("Unexpected error in fetch_binance_klines: %s", e)
+        return None
@@ -6,101 +6,121 @@ Citations:
 - RSI calculation: https://www.investopedia.com/terms/r/rsi.asp
 - MACD indicator theory: https://www.investopedia.com/terms/m/macd.asp
 - TA-Lib technical analysis library: https://ta-lib.org/
-- Pandas time series analysis: https://pandas.pydata.org/docs/user_guide/timeseries.html
+- Exponential moving averages: https://www.investopedia.com/terms/e/ema.asp
 - Technical analysis crossover patterns: https://www.investopedia.com/terms/c/crossover.asp
 """
 
-import pandas as pd
-import numpy as np
-import ta
-from config import get_indicator_periods
+import logging
 
-def calculate_technical_indicators(historical_data, indicator_window=26):
+# per-candle indicator output goes through logging - formatting is deferred to the log listener
+logger = logging.getLogger(__name__)
+
+def reset_indicator_state(state, periods):
+    """Clear the running indicator state so it can be rebuilt for the given periods."""
+    state.ema_fast = None
+    state.ema_slow = None
+    state.signal_ema = None
+    state.avg_gain = None
+    state.avg_loss = None
+    state.prev_price = None
+    state.indicator_count = 0
+    state.indicator_periods = periods
+    # smoothing factors only change with the periods - derived once here, not on every candle
+    state.indicator_factors = (
+        2 / (periods['macd_fast'] + 1),
+        2 / (periods['macd_slow'] + 1),
+        2 / (periods['signal_window'] + 1),
+        periods['rsi_window'],
+        periods['macd_slow']
+    )
+
+def _advance_indicator_state(state, price):
+    """
+    Fold one price into the running EMA/Wilder state, using the factors bound by reset_indicator_state.
+    Recurrences are seeded with the first value, matching the ta library (ewm adjust=False).
+    """
+    k_fast, k_slow, k_sig, n, macd_slow = state.indicator_factors
+
+    if state.indicator_count == 0:
+        state.ema_fast = price
+        state.ema_slow = price
+        state.avg_gain = 0.0  # ta treats the missing first difference as no movement
+        state.avg_loss = 0.0
+    else:
+        state.ema_fast = price * k_fast + state.ema_fast * (1 - k_fast)
+        state.ema_slow = price * k_slow + state.ema_slow * (1 - k_slow)
+
+        # Wilder smoothing of gains/losses
+        delta = price - state.prev_price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        state.avg_gain = (state.avg_gain * (n - 1) + gain) / n
+        state.avg_loss = (state.avg_loss * (n - 1) + loss) / n
+
+    state.prev_price = price
+    state.indicator_count += 1
+
+    # signal line starts from the first MACD value the slow EMA is valid for
+    if state.indicator_count >= macd_slow:
+        macd = state.ema_fast - state.ema_slow
+        if state.indicator_count == macd_slow:
+            state.signal_ema = macd
+        else:
+            state.signal_ema = macd * k_sig + state.signal_ema * (1 - k_sig)
+
+def seed_indicator_state(state, historical_data, periods):
+    """Rebuild the running indicator state from cached candles (warmup or window change)."""
+    reset_indicator_state(state, periods)
+    for candle in historical_data:
+        if candle['price'] is not None:
+            _advance_indicator_state(state, candle['price'])
+
+def _indicator_values(state, periods):
     """
-    Calculate MACD and RSI indicators using unified indicator_window approach.
-    All periods are derived from the main indicator_window parameter for consistency.
+    Read (rsi, macd, signal_line) from a state holding at least min_required prices.
+    Each value is None until its own window has been filled, matching the ta library.
     """
-    # get all periods derived from the main indicator window
-    periods = get_indicator_periods(indicator_window)
+    count = state.indicator_count
+    
+    rsi = None
+    if count >= periods['rsi_window']:
+        if state.avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - 100 / (1 + state.avg_gain / state.avg_loss)
+    
+    macd = state.ema_fast - state.ema_slow
+    signal_line = state.signal_ema if count - periods['macd_slow'] + 1 >= periods['signal_window'] else None
+    return rsi, macd, signal_line
+
+def update_indicators_incremental(state, price, periods):
+    """
+    Advance the running indicator state by one price and return (rsi, macd, signal_line).
+    O(1) per candle - matches the ta library's values over the full price history.
+    """
+    _advance_indicator_state(state, price)
+
     rsi_window = periods['rsi_window']
-    macd_fast = periods['macd_fast']
     macd_slow = periods['macd_slow']
     signal_window = periods['signal_window']
-    
-    # minimum data required is the largest period needed for any indicator
     min_required = max(rsi_window, macd_slow, signal_window)
-    
-    if len(historical_data) < min_required:
-        print(f"Not enough data for indicators: {len(historical_data)}/{min_required} required")
-        print(f"Periods - RSI:{rsi_window}, MACD:{macd_fast}/{macd_slow}, Signal:{signal_window}")
-        return None, None, None
-    
-    try:
-        # extract prices from historical data for indicator calculation
-        prices = []
-        for candle in historical_data:
-            if candle['price'] is not None:
-                prices.append(candle['price'])
-        
-        if len(prices) < min_required:
-            print(f"Not enough valid prices for indicators: {len(prices)}/{min_required} required")
-            return None, None, None
-            
-        prices_series = pd.Series(prices)  # convert to pandas series for ta library
-        
-        # calculate RSI using derived window - measures momentum/overbought conditions
-        latest_rsi = None
-        try:
-            if len(prices_series) >= rsi_window:
-                rsi_indicator = ta.momentum.RSIIndicator(close=prices_series, window=rsi_window)
-                rsi_values = rsi_indicator.rsi()
-                latest_rsi = rsi_values.iloc[-1] if len(rsi_values) > 0 and not pd.isna(rsi_values.iloc[-1]) else None
-        except Exception as e:
-            print(f"Error calculating RSI: {e}")
-        
-        # calculate MACD with derived periods - measures trend changes and momentum
-        latest_macd = None
-        latest_signal = None
-        try:
-            if len(prices_series) >= macd_slow:
-                macd_indicator = ta.trend.MACD(
-                    close=prices_series, 
-                    window_slow=macd_slow,    # slower moving average (26 periods typically)
-                    window_fast=macd_fast,    # faster moving average (12 periods typically)
-                    window_sign=signal_window # signal line smoothing (9 periods typically)
-                )
-                macd_values = macd_indicator.macd()
-                signal_values = macd_indicator.macd_signal()
-                
-                if len(macd_values) > 0 and not pd.isna(macd_values.iloc[-1]):
-                    latest_macd = macd_values.iloc[-1]
-                if len(signal_values) > 0 and not pd.isna(signal_values.iloc[-1]):
-                    latest_signal = signal_values.iloc[-1]
-        except Exception as e:
-            print(f"Error calculating MACD: {e}")
-        
-        # validate results to ensure we have valid numbers (not NaN or infinite)
-        def is_valid_number(value):
-            return value is not None and not pd.isna(value) and np.isfinite(value)
-        
-        final_rsi = latest_rsi if is_valid_number(latest_rsi) else None
-        final_macd = latest_macd if is_valid_number(latest_macd) else None
-        final_signal = latest_signal if is_valid_number(latest_signal) else None
-        
-        # enhanced debug output for monitoring indicator calculation
-        rsi_str = f"{final_rsi:.2f}" if final_rsi is not None else "N/A"
-        macd_str = f"{final_macd:.6f}" if final_macd is not None else "N/A"
-        signal_str = f"{final_signal:.6f}" if final_signal is not None else "N/A"
-        
-        print(f"Indicators (Window:{indicator_window}) - RSI({rsi_window}): {rsi_str}, "
-              f"MACD({macd_fast}/{macd_slow}): {macd_str}, Signal({signal_window}): {signal_str}")
-        
-        return final_rsi, final_macd, final_signal
-        
-    except Exception as e:
-        print(f"Error calculating technical indicators: {e}")
+
+    count = state.indicator_count
+    if count < min_required:
+        logger.info("Not enough data for indicators: %d/%d required", count, min_required)
         return None, None, None
 
+    rsi, macd, signal_line = _indicator_values(state, periods)
+
+    if logger.isEnabledFor(logging.INFO):
+        rsi_str = f"{rsi:.2f}" if rsi is not None else "N/A"
+        signal_str = f"{signal_line:.6f}" if signal_line is not None else "N/A"
+        logger.info("Indicators (Window:%d) - RSI(%d): %s, MACD(%d/%d): %.6f, Signal(%d): %s",
+                    macd_slow, rsi_window, rsi_str, periods['macd_fast'], macd_slow, macd,
+                    signal_window, signal_str)
+
+    return rsi, macd, signal_line
+
 def check_macd_crossover(historical_data, current_macd, current_signal):
     """
     Check for MACD crossover by comparing current and previous periods.
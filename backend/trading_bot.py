@@ -10,18 +10,26 @@ Citations:
 """
 
 import time
+import logging
 import threading
-from config import trading_state, get_indicator_periods
+from config import trading_state, get_indicator_periods, get_min_required
 from file_manager import (
     load_historical_data, load_trading_thresholds, 
     ensure_threshold_csv_exists, ensure_order_csv_exists,
     get_current_position_from_orders, get_historical_data,
-    create_parameter_summary
+    create_parameter_summary, flush_market_data
 )
-from market_data_fetcher import fetch_binance_data
-from data_processor import create_market_data_with_indicators, save_market_data
+from market_data_fetcher import fetch_binance_data, fetch_binance_klines, kline_interval_for
+from data_processor import create_market_data_with_indicators, save_market_data, backfill_market_data
 from trading_engine import check_trading_signals_with_thresholds, execute_trade
 
+# per-loop output goes through logging so the trading thread never blocks on stdout
+# (startup banners stay as prints - they run once)
+logger = logging.getLogger(__name__)
+
+# long positions profit when price goes up, short positions when it goes down
+_POSITION_SIGN = {'LONG': 1, 'SHORT': -1}
+
 def main_loop():
     """
     MAIN TRADING LOOP with unified indicator window and enhanced parameter validation.
@@ -48,6 +56,7 @@ def main_loop():
     while not trading_state.ending:
         try:
             loop_count += 1
+            tick_started = time.monotonic()  # interval is measured from here, so work time doesn't add drift
             
             # reload thresholds each loop to allow dynamic config updates without restart
             thresholds = load_trading_thresholds()
@@ -71,38 +80,46 @@ def main_loop():
                     if should_execute:
                         execute_trade(signal, market_data, thresholds)
                     elif signal not in ["NO_SIGNAL", "HOLD"]:
-                        print(f"🔍 Signal detected but not executed: {signal}")
+                        logger.info("🔍 Signal detected but not executed: %s", signal)
                     
                     # display comprehensive status information
                     display_status_info(market_data, signal, thresholds, loop_count)
                     
                 else:
-                    print("❌ Failed to save market data")
+                    logger.error("❌ Failed to save market data")
             else:
-                print("⚠️  Failed to fetch market data, retrying next cycle")
+                logger.warning("⚠️  Failed to fetch market data, retrying next cycle")
             
-            # wait before next iteration using configurable interval
-            time.sleep(loop_interval)
+            # wait out the rest of the configurable interval - wakes immediately on shutdown
+            remaining = tick_started + loop_interval - time.monotonic()
+            if remaining > 0:
+                trading_state.stop_event.wait(remaining)
+            else:
+                logger.warning("⏱️  Loop #%d overran its %ss interval by %.1fs", loop_count, loop_interval, -remaining)
             
         except KeyboardInterrupt:
             print("\n🛑 Keyboard interrupt received, stopping trading bot...")
-            trading_state.ending = True  # signal clean shutdown
+            trading_state.request_stop()  # signal clean shutdown
             break
         except Exception as e:
-            print(f"💥 Error in main loop: {e}")
-            print("🔄 Continuing to next iteration...")
-            time.sleep(5)  # brief pause before retry to avoid rapid error loops
+            logger.error("💥 Error in main loop: %s", e)
+            logger.info("🔄 Continuing to next iteration...")
+            trading_state.stop_event.wait(5)  # brief pause before retry to avoid rapid error loops
     
+    flush_market_data()  # write any buffered ticks before the loop exits
     print("🏁 Trading loop ended")
 
 def display_status_info(market_data, signal, thresholds, loop_count):
     """
     Display enhanced status information with indicators and position details.
     Provides comprehensive view of current trading state and market conditions.
+    Skipped entirely when INFO logging is off - nothing else depends on the status line.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     historical_count = len(trading_state.historical_data)
-    periods = get_indicator_periods(thresholds['indicator_window'])
-    min_required = max(periods['rsi_window'], periods['macd_slow'], periods['signal_window'])
+    min_required = get_min_required(thresholds['indicator_window'])  # memoized per window
     
     # get current trading position and P&L information
     current_position, last_trade_price = get_current_position_from_orders()
@@ -135,25 +152,24 @@ def display_status_info(market_data, signal, thresholds, loop_count):
     # current market price
     status_parts.append(f"Price: ${market_data['price']:,.2f}")
     
-    # print comprehensive status on single line
-    print(" | ".join(status_parts))
+    # log comprehensive status on single line
+    logger.info("%s", " | ".join(status_parts))
     
     # show detailed indicators periodically to avoid spam but provide insight
-    if loop_count % 5 == 0 and market_data['rsi'] is not None:
-        print(f"   📊 RSI: {market_data['rsi']:.1f}, MACD: {market_data['macd']:.6f}, Signal: {market_data['signal_line']:.6f}")
+    # (signal line fills in after RSI/MACD, so wait for it too)
+    if loop_count % 5 == 0 and market_data['rsi'] is not None and market_data['signal_line'] is not None:
+        logger.info("   📊 RSI: %.1f, MACD: %.6f, Signal: %.6f",
+                    market_data['rsi'], market_data['macd'], market_data['signal_line'])
 
 def calculate_unrealized_pnl(position_type, entry_price, current_price):
     """
     Calculate unrealized P&L percentage based on position type.
     Shows how much profit/loss would be realized if position closed now.
     """
-    if position_type == 'LONG':
-        # long position profits when price goes up
-        return ((current_price - entry_price) / entry_price) * 100
-    elif position_type == 'SHORT':
-        # short position profits when price goes down
-        return ((entry_price - current_price) / entry_price) * 100
-    return 0.0
+    sign = _POSITION_SIGN.get(position_type)
+    if sign is None:
+        return 0.0
+    return sign * (current_price - entry_price) / entry_price * 100
 
 def start_background_trading():
     """
@@ -177,8 +193,19 @@ def start_background_trading():
     
     # check if we have enough historical data for indicators
     historical_count = len(trading_state.historical_data)
-    periods = get_indicator_periods(thresholds['indicator_window'])
-    min_required = max(periods['rsi_window'], periods['macd_slow'], periods['signal_window'])
+    min_required = get_min_required(thresholds['indicator_window'])
+    
+    # one /klines request fills the gap instead of waiting min_required loop intervals
+    if historical_count < min_required:
+        print("📥 Backfilling recent candles from Binance...")
+        klines = fetch_binance_klines(kline_interval_for(thresholds['loop_interval']), min_required)
+        if klines:
+            try:
+                added = backfill_market_data(klines, thresholds['indicator_window'])
+                print(f"✅ Backfilled {added} candles")
+            except Exception as e:
+                print(f"⚠️  Backfill failed: {e}")
+        historical_count = len(trading_state.historical_data)
     
     if historical_count < min_required:
         print(f"⚠️  Warning: Only {historical_count} historical records available.")
@@ -8,11 +8,25 @@ Citations:
 - Stop loss/take profit concepts: https://www.investopedia.com/terms/s/stop-lossorder.asp
 """
 
+import logging
 from file_manager import get_current_position_from_orders, append_order_to_csv, get_historical_data
 from technical_indicators import (
     check_macd_crossover, get_macd_trend_strength, analyze_rsi_condition
 )
 
+# trade and signal messages go through logging - the per-tick HOLD analysis line is debug output
+logger = logging.getLogger(__name__)
+
+# executable signals -> (order side, log label), resolved once at import instead of per trade
+_TRADE_SIGNALS = {
+    signal: (
+        'BUY' if signal.startswith('BUY') else 'SELL',
+        signal.replace('_SIGNAL', '').replace('_LOSS', ' STOP').replace('_PROFIT', ' PROFIT')
+    )
+    for signal in ('BUY_SIGNAL', 'SELL_SIGNAL', 'SELL_STOP_LOSS', 'SELL_TAKE_PROFIT',
+                   'BUY_STOP_LOSS', 'BUY_TAKE_PROFIT')
+}
+
 def check_trading_signals_with_thresholds(market_data, thresholds):
     """
     Enhanced trading signal detection with intuitive MACD logic and RSI confirmation.
@@ -56,26 +70,26 @@ def check_stop_loss_take_profit(current_position, current_price, last_trade_pric
         # stop loss: price fell below our threshold
         if current_price <= last_trade_price * (1 - thresholds['stop_loss']):
             loss_pct = ((last_trade_price - current_price) / last_trade_price) * 100
-            print(f"💥 Stop Loss Triggered! LONG position down {loss_pct:.2f}%")
+            logger.info("💥 Stop Loss Triggered! LONG position down %.2f%%", loss_pct)
             return "SELL_STOP_LOSS", True
         
         # take profit: price rose above our target
         if current_price >= last_trade_price * (1 + thresholds['stop_profit']):
             profit_pct = ((current_price - last_trade_price) / last_trade_price) * 100
-            print(f"💰 Take Profit Triggered! LONG position up {profit_pct:.2f}%")
+            logger.info("💰 Take Profit Triggered! LONG position up %.2f%%", profit_pct)
             return "SELL_TAKE_PROFIT", True
     
     elif current_position == 'SHORT':
         # stop loss: price rose above our threshold (bad for short)
         if current_price >= last_trade_price * (1 + thresholds['stop_loss']):
             loss_pct = ((current_price - last_trade_price) / last_trade_price) * 100
-            print(f"💥 Stop Loss Triggered! SHORT position down {loss_pct:.2f}%")
+            logger.info("💥 Stop Loss Triggered! SHORT position down %.2f%%", loss_pct)
             return "BUY_STOP_LOSS", True
         
         # take profit: price fell below our target (good for short)
         if current_price <= last_trade_price * (1 - thresholds['stop_profit']):
             profit_pct = ((last_trade_price - current_price) / last_trade_price) * 100
-            print(f"💰 Take Profit Triggered! SHORT position up {profit_pct:.2f}%")
+            logger.info("💰 Take Profit Triggered! SHORT position up %.2f%%", profit_pct)
             return "BUY_TAKE_PROFIT", True
     
     return "HOLD", False
@@ -111,7 +125,7 @@ def check_new_position_signals(market_data, thresholds):
     )
     
     if buy_signal:
-        print(f"📈 BUY Signal: {buy_reason}")
+        logger.info("📈 BUY Signal: %s", buy_reason)
         return "BUY_SIGNAL", True
     
     # check sell conditions with detailed reasoning
@@ -121,12 +135,12 @@ def check_new_position_signals(market_data, thresholds):
     )
     
     if sell_signal:
-        print(f"📉 SELL Signal: {sell_reason}")
+        logger.info("📉 SELL Signal: %s", sell_reason)
         return "SELL_SIGNAL", True
     
     # log current conditions for debugging - helps with strategy optimization
-    print(f"Market Analysis - RSI: {rsi:.1f} ({rsi_condition}), MACD: {macd_trend}, "
-          f"Crossover: {crossover_strength or 'none'}")
+    logger.debug("Market Analysis - RSI: %.1f (%s), MACD: %s, Crossover: %s",
+                 rsi, rsi_condition, macd_trend, crossover_strength or 'none')
     
     return "HOLD", False
 
@@ -189,19 +203,15 @@ def execute_trade(signal, market_data, thresholds):
     Execute a trade based on the signal and log it to order.csv.
     Handles the actual trade execution and record keeping.
     """
-    # only execute actual trading signals
-    if not any(signal.endswith(suffix) for suffix in ['_SIGNAL', '_LOSS', '_PROFIT']):
+    # only execute actual trading signals - one lookup gives both the side and the log label
+    trade = _TRADE_SIGNALS.get(signal)
+    if trade is None:
         return
+    side, trade_type = trade
     
     current_price = market_data['price']
     trade_size = thresholds['trade_size']
     
-    # determine if we're buying or selling based on signal type
-    if signal.startswith('BUY'):
-        side = 'BUY'
-    else:
-        side = 'SELL'
-    
     quantity = trade_size
     
     # create structured order data for CSV logging
@@ -217,9 +227,8 @@ def execute_trade(signal, market_data, thresholds):
     append_order_to_csv(order_data)
     
     # enhanced logging with trade type classification
-    trade_type = signal.replace('_SIGNAL', '').replace('_LOSS', ' STOP').replace('_PROFIT', ' PROFIT')
-    print(f"🚨 TRADE EXECUTED: {trade_type} - {side} {quantity} at ${current_price:,.2f}")
+    logger.info("🚨 TRADE EXECUTED: %s - %s %s at $%.2f", trade_type, side, quantity, current_price)
     
     # calculate and display position value for portfolio tracking
     position_value = quantity * current_price
-    print(f"💵 Position Value: ${position_value:,.2f}")
\ No newline at end of file
+    logger.info("💵 Position Value: $%.2f", position_value)
\ No newline at end of file
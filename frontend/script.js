@@ -9,6 +9,7 @@
  * - DOM manipulation: https://developer.mozilla.org/en-US/docs/Web/API/Document_Object_Model
  * - SessionStorage for auth tokens: https://developer.mozilla.org/en-US/docs/Web/API/Window/sessionStorage
  * - JavaScript intervals: https://developer.mozilla.org/en-US/docs/Web/API/setInterval
+ * - Streaming fetch responses: https://developer.mozilla.org/en-US/docs/Web/API/Streams_API/Using_readable_streams
  * - Form validation patterns: https://developer.mozilla.org/en-US/docs/Learn/Forms/Form_validation
  */
 
@@ -28,11 +29,13 @@ const DEFAULT_CONFIG = {
 };
 
 const API_BASE_URL = 'http://localhost:5000';
+const STATUS_STREAM_RETRY_MS = 10000; // reconnect delay after the status stream drops
 
 // Application state - tracks dynamic system behavior
 let lastConnectionCheck = null;
 let currentLoopInterval = 60; // synced with backend loop timing
-let statusCheckInterval = null;
+let statusStreamController = null; // aborts the open /status-stream request
+let statusStreamRetry = null; // pending reconnect timer
 let tradesRefreshInterval = null;
 
 /**
@@ -110,7 +113,7 @@ document.addEventListener('DOMContentLoaded', function() {
  */
 async function setupDynamicRefresh() {
     await updateLoopInterval(); // get current backend timing
-    statusCheckInterval = setInterval(checkStatus, 10000); // check status every 10s
+    followStatusStream(); // backend pushes status on every new candle - no polling
     setupTradesRefresh(); // setup trades refresh based on loop interval
     setInterval(updateLoopInterval, 120000); // update timing every 2 minutes
     console.log(`⏱️ Dynamic refresh setup complete`);
@@ -174,6 +177,64 @@ async function checkStatus() {
     }
 }
 
+/**
+ * Follow the /status-stream push feed and update the UI on every event
+ * Uses fetch() rather than EventSource because EventSource can't send the Authorization header
+ */
+async function followStatusStream() {
+    const controller = new AbortController();
+    statusStreamController = controller;
+    
+    try {
+        const response = await authenticatedFetch(`${API_BASE_URL}/status-stream`, {
+            signal: controller.signal
+        });
+        
+        if (!response.ok || !response.body) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break; // server closed the stream (bot stopping)
+            buffer += value;
+            
+            // events end with a blank line; ': keepalive' comments carry no data
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const event = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                if (event.startsWith('data: ')) {
+                    updateStatusDisplay(JSON.parse(event.slice(6)));
+                    hideMessage('controlMessage'); // clear any error messages
+                }
+            }
+        }
+    } catch (error) {
+        if (error.name === 'AbortError') return; // stopped on purpose - don't reconnect
+        console.error('📡 Status stream error:', error);
+    }
+    
+    // stream dropped - show the current state once, then reconnect
+    await checkStatus();
+    if (!controller.signal.aborted) {
+        statusStreamRetry = setTimeout(followStatusStream, STATUS_STREAM_RETRY_MS);
+    }
+}
+
+/**
+ * Close the status stream and cancel any pending reconnect
+ */
+function stopStatusStream() {
+    if (statusStreamRetry) clearTimeout(statusStreamRetry);
+    if (statusStreamController) statusStreamController.abort();
+    statusStreamRetry = null;
+    statusStreamController = null;
+}
+
 /**
  * Update status display based on backend response
  * Translates backend status into user-friendly UI states
@@ -318,8 +379,8 @@ async function stopBot() {
         
         showMessage('controlMessage', 'Bot shutdown initiated!', 'success');
         
-        // cleanup intervals since backend is stopping
-        if (statusCheckInterval) clearInterval(statusCheckInterval);
+        // cleanup intervals and the status stream since backend is stopping
+        stopStatusStream();
         if (tradesRefreshInterval) clearInterval(tradesRefreshInterval);
         
         // update UI to reflect stopped state